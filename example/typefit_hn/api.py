@@ -1,7 +1,16 @@
+import httpx
+
 from typefit import api
 
 from .models import Item
 
+try:
+    import h2  # noqa: F401
+except ImportError:
+    HTTP2 = False
+else:
+    HTTP2 = True
+
 
 class HackerNews(api.SyncClient):
     """
@@ -10,6 +19,17 @@ class HackerNews(api.SyncClient):
 
     BASE_URL = "https://hacker-news.firebaseio.com/v0/"
 
+    def init_http(self) -> httpx.Client:
+        """
+        Items are usually fetched in bulk, so connections are kept alive and
+        multiplexed over HTTP/2 when the h2 package is installed.
+        """
+
+        return httpx.Client(
+            http2=HTTP2,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30),
+        )
+
     @api.get("item/{item_id}.json")
     def get_item(self, item_id: int) -> Item:
         """
@@ -1,4 +1,4 @@
-from functools import wraps
+from functools import lru_cache, wraps
 from inspect import signature
 from typing import Any, Callable, Dict, List, Optional, Text, Type, Union
 from urllib.parse import urljoin
@@ -8,7 +8,7 @@ import httpx
 from . import httpx_models as hm
 from .fitting import T, typefit
 from .serialize import SaneSerializer
-from .utils import UrlFormatter, callable_value
+from .utils import UrlFormatter, callable_value, compile_url
 
 HeadersFactory = Callable[..., hm.HeaderTypes]
 Headers = Union[None, hm.HeaderTypes, HeadersFactory]
@@ -42,6 +42,9 @@ Json = Union[None, JsonType, JsonFactory]
 OnResponse = Callable[[hm.Request, hm.Response], None]
 
 
+_join_url = lru_cache(maxsize=1024)(urljoin)
+
+
 def _make_decorator(
     method: Text,
     path: Path,
@@ -273,28 +276,39 @@ class _SyncClientHelper:
     overridden.
     """
 
-    def __init__(self, client: "SyncClient"):
+    def __init__(self, client: "SyncClient", http: Optional[httpx.Client] = None):
         self.client = client
-        self.http = httpx.Client()
+        self.owns_http = http is None
+        self.http = client.init_http() if http is None else http
         self.on_response: Optional[OnResponse] = None
 
     def close(self):
         """
-        Closes the underlying HTTP connection pool
+        Closes the underlying HTTP connection pool, unless it was provided
+        from the outside in which case its owner is in charge of closing it.
         """
 
-        self.http.close()
+        if self.owns_http:
+            self.http.close()
 
     def url(self, path: Path, kwargs: Dict[Text, Any]):
         """
         Generates the URL using urljoin in the client's BASE_URL and the
         provided path. The path could be a callable, if so it will be called
         using loose_call and the provided kwargs.
+
+        Notes
+        -----
+        Static paths always give the same template, which is then compiled
+        once (see :py:func:`~.typefit.utils.compile_url`). Paths generated by
+        a callable can be different at each call so they're simply formatted.
         """
 
-        f = UrlFormatter()
+        if isinstance(path, str):
+            return compile_url(_join_url(self.client.BASE_URL, path))(kwargs)
+
         url = urljoin(self.client.BASE_URL, callable_value(path, kwargs))
-        return f.format(url, **kwargs)
+        return UrlFormatter().vformat(url, (), kwargs)
 
     def headers(self, extra: Headers, kwargs: Dict[Text, Any]) -> hm.Headers:
         """
@@ -382,19 +396,11 @@ class _SyncClientHelper:
         method.
         """
 
-        cookies = self.cookies(cookies, kwargs)
-        old_cookies = None
-
-        if cookies:
-            old_cookies = self.http.cookies
-            self.http.cookies = cookies
-
         request_args = dict(
             url=self.url(path, kwargs),
             headers=self.headers(headers, kwargs),
             params=callable_value(params, kwargs),
-            auth=self.auth(auth, kwargs),
-            follow_redirects=self.follow_redirects(follow_redirects, kwargs),
+            cookies=self.cookies(cookies, kwargs),
         )
 
         if method in {"post", "put", "patch"}:
@@ -404,7 +410,13 @@ class _SyncClientHelper:
                 json=self.client.serialize(callable_value(json, kwargs)),
             )
 
-        r: hm.Response = getattr(self.http, method)(**request_args)
+        # Cookies are given to the request rather than set on the HTTP client,
+        # which might be shared with other API clients
+        r: hm.Response = self.http.send(
+            self.http.build_request(method.upper(), **request_args),
+            auth=self.auth(auth, kwargs),
+            follow_redirects=self.follow_redirects(follow_redirects, kwargs),
+        )
 
         if self.on_response and r:
             self.on_response(r._request, r)
@@ -413,9 +425,6 @@ class _SyncClientHelper:
         data = self.client.decode(r, hint)
         data = self.client.extract(data, hint)
 
-        if cookies:
-            self.http.cookies = old_cookies
-
         return self.client.typefit(data_type, data)
 
 
@@ -427,12 +436,32 @@ class SyncClient:
 
     BASE_URL = ""
 
-    def __init__(self):
-        self.helper = _SyncClientHelper(self)
+    def __init__(self, http: Optional[httpx.Client] = None):
+        """
+        Constructs the client.
+
+        Parameters
+        ----------
+        http
+            HTTPX client to use for requests. By default each instance creates
+            its own (see :py:meth:`~.init_http`), but you can share one between
+            several API clients in order to re-use its connection pool.
+        """
+
+        self.helper = _SyncClientHelper(self, http)
         self.helper.on_response = self.on_response
         self.serialize = self.init_serialize()
         self.typefit = self.init_typefit()
 
+    def init_http(self) -> httpx.Client:
+        """
+        Creates the HTTPX client of this instance when none is given to the
+        constructor. Override it to configure the connection pool (limits,
+        timeouts, HTTP/2, ...).
+        """
+
+        return httpx.Client()
+
     def init_typefit(self) -> Callable[[Type[T], Any], T]:
         """
         Uses :py:func:`~.typefit.typefit` by default, however you might want to
@@ -466,6 +495,12 @@ class SyncClient:
 
         self.helper.close()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def headers(self) -> Optional[hm.HeaderTypes]:
         """
         Inherit this to generate headers that will be sent at each request.
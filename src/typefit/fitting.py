@@ -1,21 +1,95 @@
 from collections import abc
+from dataclasses import is_dataclass
 from enum import Enum
 from inspect import isclass
 from types import UnionType
 from typing import (
     Any,
     Callable,
+    Dict,
     Literal,
     Mapping,
     MutableSequence,
     Optional,
+    Set,
+    Text,
+    Tuple,
     Type,
     Union,
 )
 
 from .compat import get_args, get_origin
 from .nodes import *
+from .nodes import get_fit_plan
 from .reporting import ErrorReporter, LogErrorReporter, PrettyJson5Formatter
+from .utils import OrderedSet, is_named_tuple, type_cache
+
+# Nodes whose fitting doesn't need any routing from the Fitter as long as the
+# target type is neither a Union nor Any (see Fitter.fit_node_fast)
+_NODE_FIT = {
+    MappingNode: MappingNode.fit,
+    ListNode: ListNode.fit,
+    LiteralNode: LiteralNode.fit,
+}
+
+# Values that a FlatNode must have in order to fit into these builtins (see
+# FlatNode.fit_builtin and Fitter._fit_none)
+_FLAT_ACCEPTS = {
+    int: int,
+    float: (int, float),
+    str: str,
+    bool: bool,
+    type(None): type(None),
+}
+
+
+@type_cache
+def _union_member_check(t: Any) -> Optional[Tuple[Text, Any]]:
+    """
+    Finds a cheap way to tell that a member of a union can't fit a node,
+    without trying to fit it (see :py:meth:`~.Fitter._fit_union`). Returns
+    None when there is no such way. This only depends on the type so it's
+    computed once per type.
+
+    - ``("flat", types)`` -- Flat values have to be an instance of types
+    - ``("keys", keys)`` -- Mappings have to contain all these keys
+    """
+
+    try:
+        if t in _FLAT_ACCEPTS:
+            return "flat", _FLAT_ACCEPTS[t]
+    except TypeError:
+        return None
+
+    if not (isclass(t) and (is_dataclass(t) or is_named_tuple(t))):
+        return None
+
+    try:
+        plan = get_fit_plan(t)
+    except Exception:
+        return None
+
+    if plan.sources:
+        return None
+
+    return "keys", plan.required - set(plan.contexts) - set(plan.root_fields)
+
+
+def _may_fit(check: Optional[Tuple[Text, Any]], value: Node) -> bool:
+    """
+    Applies a check from :py:func:`~._union_member_check` to a node. Only
+    returns False if the fit would fail for sure.
+    """
+
+    if check is None:
+        return True
+
+    kind, arg = check
+
+    if kind == "flat":
+        return value.__class__ is not FlatNode or isinstance(value.value, arg)
+    else:
+        return value.__class__ is not MappingNode or arg <= value.children.keys()
 
 
 class Fitter:
@@ -60,6 +134,36 @@ class Fitter:
         self.error_reporter = error_reporter
         self.context = context or {}
         self.root_injectors: MutableSequence[Callable[[Any], None]] = []
+        self._context_getters: Dict[str, Callable[[], Any]] = {}
+
+    def context_getter(self, key: str) -> Callable[[], Any]:
+        """
+        Returns a function that reads the key from this fitter's context,
+        raising a ValueError if the key is missing. There is one function per
+        key for the whole fitter instead of one per injected field. The
+        context is read when the function is called, so it can be replaced
+        on the fitter.
+
+        Parameters
+        ----------
+        key
+            Context key to read
+        """
+
+        try:
+            return self._context_getters[key]
+        except KeyError:
+            pass
+
+        def get_value() -> Any:
+            try:
+                return self.context[key]
+            except KeyError as e:
+                raise ValueError(f"Key {key!r} is missing from the context") from e
+
+        self._context_getters[key] = get_value
+
+        return get_value
 
     def _as_node(self, value: Any):
         """
@@ -89,13 +193,52 @@ class Fitter:
         """
         In case of a union, walk through all possible types and try them on
         until one fits (fails otherwise).
+
+        Notes
+        -----
+        Types which obviously can't fit the value (like a str for an int or a
+        dataclass whose required keys are missing) are tried only if nothing
+        else fits. They're still tried in order to report their errors, which
+        are recorded separately for each member and then put back into the
+        node's errors in the order of the union's members.
         """
 
-        for sub_t in get_args(t):
-            try:
-                return self.fit_node(sub_t, value)
-            except ValueError:
-                continue
+        args = get_args(t)
+        errors = value.errors
+        attempts: Dict[int, Set[Text]] = {}
+        skipped = []
+
+        try:
+            for i, sub_t in enumerate(args):
+                try:
+                    check = _union_member_check(sub_t)
+                except TypeError:
+                    check = None
+
+                if not _may_fit(check, value):
+                    skipped.append(i)
+                    continue
+
+                value.errors = attempts[i] = OrderedSet()
+
+                try:
+                    return self.fit_node(sub_t, value)
+                except ValueError:
+                    continue
+
+            for i in skipped:
+                value.errors = attempts[i] = OrderedSet()
+
+                try:
+                    return self.fit_node(args[i], value)
+                except ValueError:
+                    continue
+        finally:
+            value.errors = errors
+
+            for i in sorted(attempts):
+                for error in attempts[i]:
+                    errors.add(error)
 
         value.fail("No matching type in Union")
 
@@ -200,6 +343,34 @@ class Fitter:
         else:
             value.fail("Could not fit. This error can never be reached in theory.")
 
+    def fit_node_fast(self, t: Type[T], value: Node) -> T:
+        """
+        Same as :py:meth:`~.fit_node` but skips the routing when the node's
+        class can do the fitting on its own, which is the case of mappings,
+        lists and literals unless we're fitting into a Union or Any.
+
+        Parameters
+        ----------
+        t
+            Type you want to fit your node into
+        value
+            A node you want to fit into a type
+
+        Raises
+        ------
+        ValueError
+        """
+
+        fit = _NODE_FIT.get(value.__class__)
+
+        if fit is not None and (
+            value.__class__ is LiteralNode
+            or not (t is Any or get_origin(t) in (Union, UnionType))
+        ):
+            return fit(value, t)
+
+        return self.fit_node(t, value)
+
     def fit(self, t: Type[T], value: Any) -> T:
         """
         Fits data into a type. The data is expected to be JSON-decoded values
@@ -226,6 +397,10 @@ class Fitter:
         all we got to do is to call all the root injectors (no need to recurse
         into anything, yay).
 
+        The injectors are consumed by the fit that registered them, so that a
+        fitter can be used several times (or recursively) without injecting
+        a root into the objects of a previous fit.
+
         Parameters
         ----------
         t
@@ -239,15 +414,22 @@ class Fitter:
         """
 
         node = self._as_node(value)
+        injectors = self.root_injectors
+        start = len(injectors)
 
         try:
             out = self.fit_node(t, node)
         except ValueError:
+            del injectors[start:]
+
             if self.error_reporter:
                 self.error_reporter.report(node)
             raise
         else:
-            for injector in self.root_injectors:
+            pending = injectors[start:]
+            del injectors[start:]
+
+            for injector in pending:
                 injector(out)
 
             return out
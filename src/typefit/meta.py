@@ -1,4 +1,9 @@
-from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Text
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Text, Tuple
+from weakref import WeakKeyDictionary
+
+from .utils import type_cache
 
 
 class Source(NamedTuple):
@@ -13,6 +18,18 @@ class Source(NamedTuple):
     value_to_json: Callable[[Text, Any], Dict]
 
 
+@dataclass(frozen=True, slots=True)
+class _Meta:
+    """
+    Typefit options of a field, as stored into its metadata by
+    :py:func:`~.meta`.
+    """
+
+    source: Optional[Source] = None
+    context: Optional[Text] = None
+    inject_root: bool = False
+
+
 def meta(
     source: Optional[Source] = None,
     inject_root: bool = False,
@@ -47,21 +64,34 @@ def meta(
         you want to inject a value from the context into the object.
     """
 
-    out = {}
-
     if sum([inject_root, context is not None, source is not None]) > 1:
         raise ValueError("Only one of inject_root, context and source can be provided.")
 
-    if source:
-        out["typefit_source"] = source
+    return {
+        "typefit": _Meta(
+            source=source or None,
+            context=context or None,
+            inject_root=bool(inject_root),
+        )
+    }
+
 
-    if inject_root:
-        out["typefit_inject_root"] = True
+def _intern_key(key: Any) -> Any:
+    """
+    Interns the keys that are looked up in contexts and JSON objects (or
+    written into them by the serializer). The same keys come back for each
+    object, and when both sides are interned (like string literals in the
+    code) dictionaries can compare them by identity.
+    """
 
-    if context:
-        out["typefit_from_context"] = context
+    if type(key) is str:
+        return sys.intern(key)
 
-    return out
+    return key
+
+
+# Keys of the sources created by other_field(), by their to-JSON function
+_OTHER_FIELD_KEYS: "WeakKeyDictionary[Callable, Text]" = WeakKeyDictionary()
 
 
 def other_field(name: Text) -> Source:
@@ -74,10 +104,89 @@ def other_field(name: Text) -> Source:
         Name of the field to look for the value into.
     """
 
+    name = _intern_key(name)
+
     def from_json(mapping: Mapping) -> Any:
         return mapping[name]
 
     def to_json(field_name: Text, obj: Any) -> Dict:
         return {name: getattr(obj, field_name)}
 
+    _OTHER_FIELD_KEYS[to_json] = name
+
     return Source(from_json, to_json)
+
+
+def other_field_key(source: Source) -> Optional[Text]:
+    """
+    If the source was created by :py:func:`~.other_field`, returns the key
+    that it reads and writes, which allows the serializer to generate
+    specialized code. Returns None for any other source, since only the
+    source itself knows how it converts values.
+
+    Parameters
+    ----------
+    source
+        Any source
+    """
+
+    try:
+        return _OTHER_FIELD_KEYS.get(source.value_to_json)
+    except TypeError:
+        return None
+
+
+class FieldPlan(NamedTuple):
+    """
+    Typefit metadata of a dataclass field, as generated by :py:func:`~.meta`.
+    At most one of ``source``, ``context`` and ``inject_root`` is set.
+    """
+
+    name: Text
+    source: Optional[Source] = None
+    context: Optional[Text] = None
+    inject_root: bool = False
+
+
+@type_cache
+def field_plans(cls: type) -> Tuple[FieldPlan, ...]:
+    """
+    Reads the metadata of all the fields of a dataclass. This is shared by
+    the fitting and the serialization, and only done once per class.
+
+    Metadata is expected to come from :py:func:`~.meta`, however the
+    individual ``typefit_*`` keys that it used to generate are still
+    understood.
+
+    Parameters
+    ----------
+    cls
+        Dataclass to inspect
+    """
+
+    out = []
+
+    for field in fields(cls):
+        md = field.metadata
+
+        if not md:
+            out.append(FieldPlan(field.name))
+        elif (options := md.get("typefit")) is not None:
+            out.append(
+                FieldPlan(
+                    field.name,
+                    source=options.source,
+                    context=_intern_key(options.context),
+                    inject_root=options.inject_root,
+                )
+            )
+        elif (source := md.get("typefit_source")) is not None:
+            out.append(FieldPlan(field.name, source=source))
+        elif (context := md.get("typefit_from_context")) is not None:
+            out.append(FieldPlan(field.name, context=_intern_key(context)))
+        else:
+            out.append(
+                FieldPlan(field.name, inject_root=bool(md.get("typefit_inject_root")))
+            )
+
+    return tuple(out)
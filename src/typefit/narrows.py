@@ -1,10 +1,95 @@
-from typing import Text
+from functools import lru_cache, wraps
+from typing import Any, Callable, Text, TypeVar
+
+T = TypeVar("T")
+
+# Size of the cache of each narrow. The same values (like dates) tend to come
+# back a lot in big JSON documents so parsing them only once is worth it. The
+# caches are created on the first parsing, so setting this to 0 before that
+# disables them.
+CACHE_SIZE = 4096
+
+
+def _memoize(func: Callable[[Any], T]) -> Callable[[Any], T]:
+    """
+    Caches the results of a parsing function, including its failures (an
+    exception of the same type and with the same arguments will be raised
+    again, from the original one, without re-parsing the value).
+    """
+
+    def attempt(value):
+        try:
+            return True, func(value)
+        except ValueError as e:
+            return False, e
+
+    cached = None
+
+    @wraps(func)
+    def wrapper(value):
+        nonlocal cached
+
+        if cached is None:
+            cached = lru_cache(maxsize=CACHE_SIZE, typed=True)(attempt)
+
+        success, out = cached(value)
+
+        if not success:
+            raise out.__class__(*out.args) from out
+
+        return out
+
+    return wrapper
+
 
 try:
     import pendulum
 except ImportError:
     pass
 else:
+
+    @_memoize
+    def _parse(date: Text) -> Any:
+        """
+        Cached pendulum parsing. Strings that only contain a time are put on
+        today's date by pendulum, in which case ``None`` is returned since the
+        result can't be cached (see :py:func:`~._parse_date_time`).
+
+        Notes
+        -----
+        The string is parsed only once, in "exact" mode, so that times can be
+        told apart. Dates are then converted into a DateTime the same way
+        pendulum does it.
+        """
+
+        out = pendulum.parse(date, exact=True)
+
+        if isinstance(out, pendulum.Time):
+            return None
+        elif isinstance(out, pendulum.Date) and not isinstance(out, pendulum.DateTime):
+            return pendulum.datetime(out.year, out.month, out.day)
+
+        return out
+
+    def _parse_date_time(date: Text) -> Any:
+        """
+        Parses the date with pendulum. Relative values ("now" or a time
+        without a date) change over time and can't be cached.
+        """
+
+        if date == "now" or (out := _parse(date)) is None:
+            return pendulum.parse(date)
+
+        return out
+
+    @_memoize
+    def _from_timestamp(date: int) -> pendulum.DateTime:
+        """
+        Cached conversion of Unix timestamps into pendulum DateTime
+        """
+
+        return pendulum.from_timestamp(date)
+
     # noinspection PyInitNewSignature
     class DateTime(pendulum.DateTime):
         """
@@ -12,7 +97,7 @@ else:
         """
 
         def __new__(cls, date: Text) -> pendulum.DateTime:
-            self = pendulum.parse(date)
+            self = _parse_date_time(date)
 
             if not isinstance(self, pendulum.DateTime):
                 raise ValueError
@@ -26,7 +111,7 @@ else:
         """
 
         def __new__(cls, date: int) -> pendulum.DateTime:
-            return pendulum.from_timestamp(date)
+            return _from_timestamp(date)
 
     # noinspection PyInitNewSignature
     class Date(pendulum.Date):
@@ -35,7 +120,7 @@ else:
         """
 
         def __new__(cls, date: Text) -> pendulum.Date:
-            self = pendulum.parse(date)
+            self = _parse_date_time(date)
 
             if isinstance(self, pendulum.DateTime):
                 self = self.date()
@@ -1,10 +1,12 @@
-from dataclasses import dataclass, field, fields, is_dataclass
-from inspect import Parameter, Signature, isclass, signature
+from dataclasses import dataclass, field, is_dataclass
+from inspect import Parameter, isclass, signature
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Mapping,
@@ -16,11 +18,12 @@ from typing import (
     Tuple,
     Type,
     TypeVar,
-    get_type_hints,
 )
+from weakref import WeakKeyDictionary
 
 from .compat import get_args, get_origin
-from .utils import OrderedSet, format_type_name, is_named_tuple
+from .meta import field_plans
+from .utils import OrderedSet, format_type_name, is_named_tuple, type_cache, type_hints
 
 if TYPE_CHECKING:
     from .fitting import Fitter
@@ -31,6 +34,29 @@ __all__ = ["T", "Node", "MappingNode", "ListNode", "FlatNode", "LiteralNode"]
 
 T = TypeVar("T")
 
+_FIT_PLANS: "WeakKeyDictionary[type, FitPlan]" = WeakKeyDictionary()
+
+# Types that a list can contain as-is, provided that every item is exactly of
+# this type (by example a bool also is an int but it's not exactly an int).
+_FLAT_TYPES = frozenset({int, float, str, bool})
+
+# Injections of objects that don't have any field to inject, shared by all of
+# them (see MappingNode.parse_dataclass)
+_NO_INJECTIONS: Mapping[str, Any] = MappingProxyType({})
+
+# JSON numbers, which all fit into a float
+_NUMBERS = frozenset({int, float})
+
+
+def _is_flat_type(t: Any) -> bool:
+    """
+    Tells if the type is one of :py:data:`~._FLAT_TYPES`. Only actual classes
+    are looked up since some type hints (like a Literal of a list) can't be
+    hashed.
+    """
+
+    return type(t) is type and t in _FLAT_TYPES
+
 
 def set_root_attr(obj: Any, attr: str):
     """
@@ -48,7 +74,241 @@ def set_root_attr(obj: Any, attr: str):
     return do_it
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class FitPlan:
+    """
+    Result of the introspection of a dataclass or named tuple. Everything in
+    there only depends on the type so it's computed once and then re-used for
+    each fit (see :py:func:`~.get_fit_plan`).
+
+    Other Parameters
+    ----------------
+    params
+        Name of constructor parameters that can be called by keyword, in order
+    hints
+        Type hints of the type
+    expected
+        Same as ``params`` but as a set
+    required
+        Parameters that don't have a default value
+    sources
+        Source functions of fields that have a ``source`` metadata
+    contexts
+        Context key of fields that have a ``context`` metadata
+    root_fields
+        Fields into which the root object has to be injected
+    """
+
+    params: Tuple[str, ...]
+    hints: Mapping[str, Any]
+    expected: FrozenSet[str]
+    required: FrozenSet[str]
+    sources: Mapping[str, Callable[[Mapping[str, Any]], Any]]
+    contexts: Mapping[str, str]
+    root_fields: Tuple[str, ...]
+
+
+def _make_fit_plan(t: Type) -> FitPlan:
+    """
+    Does the actual introspection for :py:func:`~.get_fit_plan`
+    """
+
+    params = [
+        p
+        for p in signature(t).parameters.values()
+        if p.kind in {Parameter.KEYWORD_ONLY, Parameter.POSITIONAL_OR_KEYWORD}
+    ]
+    sources = {}
+    contexts = {}
+    root_fields = []
+
+    if is_dataclass(t):
+        for plan in field_plans(t):
+            if plan.source is not None:
+                sources[plan.name] = plan.source.value_from_json
+            elif plan.context is not None:
+                contexts[plan.name] = plan.context
+            elif plan.inject_root:
+                root_fields.append(plan.name)
+
+    return FitPlan(
+        params=tuple(p.name for p in params),
+        hints=type_hints(t),
+        expected=frozenset(p.name for p in params),
+        required=frozenset(p.name for p in params if p.default is p.empty),
+        sources=sources,
+        contexts=contexts,
+        root_fields=tuple(root_fields),
+    )
+
+
+def get_fit_plan(t: Type) -> FitPlan:
+    """
+    Returns the :py:class:`~.FitPlan` of a dataclass or named tuple. It is
+    computed on the first fit of this type, which also means that forward
+    references only have to be resolvable by then.
+
+    Notes
+    -----
+    The plan is stored on the class itself as ``__typefit_plan__`` (like
+    :py:func:`~.typefit.utils.type_hints` does). Plans refer to the type
+    hints of the class, which can contain the class itself (by example in a
+    tree), so storing them in a weak dictionary would keep such classes alive
+    forever. Such a dictionary is only used for classes whose attributes
+    can't be set.
+
+    Parameters
+    ----------
+    t
+        Dataclass or named tuple to be fitted
+    """
+
+    try:
+        return t.__dict__["__typefit_plan__"]
+    except (AttributeError, KeyError):
+        pass
+
+    try:
+        return _FIT_PLANS[t]
+    except (KeyError, TypeError):
+        pass
+
+    plan = _make_fit_plan(t)
+
+    try:
+        setattr(t, "__typefit_plan__", plan)
+    except (AttributeError, TypeError):
+        try:
+            _FIT_PLANS[t] = plan
+        except TypeError:
+            pass
+
+    return plan
+
+
+def _mapping_item_types(t: Type) -> Tuple[Any, Any, bool]:
+    """
+    Normalizes the key and value types of a mapping type: unspecified or
+    generic types are collapsed into ``Text`` for the key and ``Any`` for the
+    value. Also indicates if the key type is a string type, since that's the
+    only kind of keys that JSON supports.
+
+    Parameters
+    ----------
+    t
+        Mapping type (like ``Dict[Text, int]``)
+    """
+
+    args = get_args(t)
+
+    try:
+        key_t, value_t = args
+    except ValueError:
+        key_t, value_t = Text, Any
+
+    if isinstance(key_t, TypeVar):
+        key_t = Text
+
+    if isinstance(value_t, TypeVar):
+        value_t = Any
+
+    return key_t, value_t, isclass(key_t) and issubclass(key_t, str)
+
+
+_mapping_item_types_cached = type_cache(_mapping_item_types)
+
+
+@type_cache
+def _wrong_keys_banner(t: Type) -> Text:
+    """
+    Beginning of the error message of objects that can't be fitted, which
+    only depends on the type.
+    """
+
+    return f"Wrong keys set for {format_type_name(t)}"
+
+
+# Kinds of types that mapping and list nodes can fit into, see _container_kind()
+_KIND_OTHER = 0
+_KIND_DICT = 1
+_KIND_OBJECT = 2
+_KIND_SEQUENCE = 3
+
+
+def _find_container_kind(t: Any) -> int:
+    """
+    Decomposes the type once in order to know which kind of container it is
+    (if any). See :py:func:`~._container_kind`.
+    """
+
+    origin = get_origin(t)
+
+    if origin is dict or (isclass(origin) and issubclass(origin, Mapping)):
+        return _KIND_DICT
+    elif is_named_tuple(t) or is_dataclass(t):
+        return _KIND_OBJECT
+    elif origin is list or (isclass(origin) and issubclass(origin, Sequence)):
+        return _KIND_SEQUENCE
+
+    return _KIND_OTHER
+
+
+_container_kind_cached = type_cache(_find_container_kind)
+
+
+def _container_kind(t: Any) -> int:
+    """
+    Tells if the type is a dict, an object (dataclass or named tuple), a
+    sequence or something else. That is a small integer cached for each type,
+    instead of looking at the origin of the type for each fitted node.
+
+    Parameters
+    ----------
+    t
+        Type that a node is being fitted into
+    """
+
+    try:
+        return _container_kind_cached(t)
+    except TypeError:
+        return _find_container_kind(t)
+
+
+@type_cache
+def _flat_class_plan(t: Type) -> Tuple[Any, Optional[Text]]:
+    """
+    Inspects the constructor of a class in order to know if it can be used to
+    fit a flat value. Since the signature of a class doesn't change, this is
+    done only once per type.
+
+    Returns a tuple containing the annotation of the constructor's only
+    argument and an error message. If the error is not None then the class
+    can't be used.
+
+    Parameters
+    ----------
+    t
+        Class whose constructor is inspected
+    """
+
+    try:
+        sig = signature(t).bind(None)
+    except TypeError:
+        return (
+            None,
+            "Constructor should be callable with exactly 1 positional argument",
+        )
+
+    (param_name,) = sig.arguments
+    param: Parameter = sig.signature.parameters[param_name]
+
+    if param.annotation is param.empty:
+        return None, "Constructor does not specify argument type"
+
+    return param.annotation, None
+
+
+@dataclass(slots=True)
 class Node:
     """
     Typefit is made to convert JSON structure into Python dataclasses and
@@ -118,7 +378,7 @@ class Node:
         raise ValueError(reason)
 
 
-@dataclass
+@dataclass(slots=True)
 class MappingNode(Node):
     """
     Those nodes are triggered by JSON "objects". They can map into different
@@ -172,37 +432,27 @@ class MappingNode(Node):
             Should be a dictionary specification, otherwise it's going to fail
         """
 
-        args = get_args(t)
-
         try:
-            key_t, value_t = args
-        except ValueError:
-            key_t, value_t = Text, Any
-
-        if isinstance(key_t, TypeVar):
-            key_t = Text
+            _, value_t, key_is_str = _mapping_item_types_cached(t)
+        except TypeError:
+            _, value_t, key_is_str = _mapping_item_types(t)
 
-        if not issubclass(key_t, str):
+        if not key_is_str:
             self.fail("Dictionaries with non-string keys are not supported")
 
-        if isinstance(value_t, TypeVar):
-            value_t = Any
-
-        failed = [False]
-
-        def make_dict():
-            for k, v in self.children.items():
-                try:
-                    if not isinstance(k, str):
-                        v.fail(f"Key {k!r} is not a string")
+        failed = False
+        out = {}
 
-                    yield k, self.fitter.fit_node(value_t, v)
-                except ValueError:
-                    failed[0] = True
+        for k, v in self.children.items():
+            try:
+                if not isinstance(k, str):
+                    v.fail(f"Key {k!r} is not a string")
 
-        out = dict(make_dict())
+                out[k] = self.fitter.fit_node(value_t, v)
+            except ValueError:
+                failed = True
 
-        if failed[0]:
+        if failed:
             self.problem_is_kids = True
             self.fail("Not all items are fit")
 
@@ -215,6 +465,9 @@ class MappingNode(Node):
         when doing context injection
         """
 
+        if self.context is self.fitter.context:
+            return self.fitter.context_getter(key)
+
         def get_value() -> Any:
             try:
                 return self.context[key]
@@ -260,21 +513,16 @@ class MappingNode(Node):
             Type-annotated named tuple class or dataclass
         """
 
-        sig = signature(t)
-        hints = get_type_hints(t)
+        plan = get_fit_plan(t)
 
         fields_injections, fields_sources, root_fields = self.parse_dataclass(t)
 
-        (
-            expected,
-            failed_keys,
-            kwargs,
-            literal_nodes,
-            required,
-        ) = self.make_constructor_kwargs(fields_injections, fields_sources, hints, sig)
+        failed_keys, kwargs, literal_nodes = self.make_constructor_kwargs(
+            plan, fields_injections
+        )
 
-        missing = required - set(kwargs) - set(failed_keys)
-        unwanted = set(self.children) - expected
+        missing = plan.required - set(kwargs) - set(failed_keys)
+        unwanted = set(self.children) - plan.expected
         errors = []
 
         self.report_missing(errors, missing)
@@ -283,7 +531,7 @@ class MappingNode(Node):
 
         if errors:
             self.problem_is_kids = True
-            self.fail(". ".join([f"Wrong keys set for {format_type_name(t)}", *errors]))
+            self.fail(". ".join([_wrong_keys_banner(t), *errors]))
 
         return self.make_out_instance(kwargs, root_fields, t)
 
@@ -306,38 +554,25 @@ class MappingNode(Node):
             The type of the object that we're instantiating
         """
 
-        root_fields = []
-        fields_sources = {}
-        fields_injections = {}
+        plan = get_fit_plan(t)
+
+        if not plan.contexts and not plan.root_fields:
+            return _NO_INJECTIONS, plan.sources, plan.root_fields
 
-        if not is_dataclass(t):
-            return fields_injections, fields_sources, root_fields
+        fields_injections = {
+            name: self.value_from_context(key) for name, key in plan.contexts.items()
+        }
 
-        for t_field in fields(t):
-            match (t_field.metadata):
-                case {"typefit_source": source}:
-                    fields_sources[t_field.name] = source.value_from_json
-                case {"typefit_from_context": key}:
-                    fields_injections[t_field.name] = self.value_from_context(key)
-                case {"typefit_inject_root": True}:
-                    fields_injections[t_field.name] = None
-                    root_fields.append(t_field.name)
+        for name in plan.root_fields:
+            fields_injections[name] = None
 
-        return fields_injections, fields_sources, root_fields
+        return fields_injections, plan.sources, plan.root_fields
 
     def make_constructor_kwargs(
         self,
+        plan: FitPlan,
         fields_injections: Mapping[str, Any],
-        fields_sources: Mapping[str, Callable[[Mapping[str, Any]], Any]],
-        hints: Any,
-        sig: Signature,
-    ) -> Tuple[
-        Set[str],
-        Sequence[str],
-        Mapping[str, Any],
-        Mapping[str, "LiteralNode"],
-        Set[str],
-    ]:
+    ) -> Tuple[Sequence[str], Mapping[str, Any], Mapping[str, "LiteralNode"]]:
         """
         We're going through every field of the constructor's signature and we
         try to fit the corresponding value from the input JSON.
@@ -356,55 +591,39 @@ class MappingNode(Node):
 
         Parameters
         ----------
+        plan
+            Fit plan of the type that we're instantiating
         fields_injections
             The mapping of keys to the injection functions
-        fields_sources
-            The mapping of keys to the mapping functions
-        hints
-            The type hints of the constructor
-        sig
-            The signature of the constructor
         """
 
         literal_nodes: Dict[str, LiteralNode] = {}
         kwargs = {}
-        required = set()
-        expected = set()
         failed_keys = []
+        hints = plan.hints
+        fields_sources = plan.sources
 
-        param: Parameter
-        for param in sig.parameters.values():
-            if param.kind not in {
-                Parameter.KEYWORD_ONLY,
-                Parameter.POSITIONAL_OR_KEYWORD,
-            }:
-                continue
-
-            expected.add(param.name)
-
-            if param.default is param.empty:
-                required.add(param.name)
-
+        for name in plan.params:
             try:
-                if param.name in fields_sources:
-                    sub_v = fields_sources[param.name](self.children)
-                elif param.name in fields_injections:
-                    sub_v = LiteralNode(self.fitter, fields_injections[param.name])
-                    literal_nodes[param.name] = sub_v
+                if name in fields_sources:
+                    sub_v = fields_sources[name](self.children)
+                elif name in fields_injections:
+                    sub_v = LiteralNode(self.fitter, fields_injections[name])
+                    literal_nodes[name] = sub_v
                 else:
-                    sub_v = self.children[param.name]
+                    sub_v = self.children[name]
 
-                if param.name not in hints:
+                if name not in hints:
                     sub_v.fail("Missing typing annotations")
             except KeyError:
                 pass
             else:
                 try:
-                    kwargs[param.name] = self.fitter.fit_node(hints[param.name], sub_v)
+                    kwargs[name] = self.fitter.fit_node_fast(hints[name], sub_v)
                 except ValueError:
-                    failed_keys.append(param.name)
+                    failed_keys.append(name)
 
-        return expected, failed_keys, kwargs, literal_nodes, required
+        return failed_keys, kwargs, literal_nodes
 
     def report_missing(
         self, errors: MutableSequence[str], missing: Iterable[str]
@@ -481,16 +700,17 @@ class MappingNode(Node):
             The mapping of keys to the literal nodes
         """
 
-        if failed_keys:
-            if normal_failed_keys := set(failed_keys) - fields_injections.keys():
-                errors.append(
-                    f'No fit for keys: {", ".join(repr(x) for x in normal_failed_keys)}'
-                )
+        if not failed_keys:
+            return
+
+        if normal_failed_keys := [k for k in failed_keys if k not in fields_injections]:
+            errors.append(
+                f'No fit for keys: {", ".join(repr(x) for x in normal_failed_keys)}'
+            )
 
-            for key in failed_keys:
-                if key in literal_nodes:
-                    for error in literal_nodes[key].errors:
-                        errors.append(error)
+        for key in failed_keys:
+            if key in literal_nodes:
+                errors.extend(literal_nodes[key].errors)
 
     def make_out_instance(
         self, kwargs: Mapping[str, Any], root_fields: Sequence[str], t: Type[T]
@@ -533,17 +753,17 @@ class MappingNode(Node):
             @dataclass
         """
 
-        origin = get_origin(t)
+        kind = _container_kind(t)
 
-        if origin is dict or (isclass(origin) and issubclass(origin, Mapping)):
+        if kind == _KIND_DICT:
             return self.fit_dict(t)
-        elif is_named_tuple(t) or is_dataclass(t):
+        elif kind == _KIND_OBJECT:
             return self.fit_object(t)
         else:
             self.fail(f"{format_type_name(t)} is not a mapping type")
 
 
-@dataclass
+@dataclass(slots=True)
 class ListNode(Node):
     """
     Node that is parent to a list of other nodes. That's basically the
@@ -567,11 +787,7 @@ class ListNode(Node):
         to try fitting the rest, for error reporting purposes.
         """
 
-        origin = get_origin(t)
-        is_list = origin is list
-        is_seq = isclass(origin) and issubclass(origin, Sequence)
-
-        if not (is_list or is_seq):
+        if _container_kind(t) != _KIND_SEQUENCE:
             self.fail(f"{format_type_name(t)} is not a list")
 
         args = get_args(t)
@@ -579,12 +795,37 @@ class ListNode(Node):
         if not args:
             self.fail("Could not determine list item type")
 
+        item_t = args[0]
+
+        if _is_flat_type(item_t):
+            if all(type(x) is item_t for x in self.value):
+                out = list(self.value)
+            elif item_t is float and all(type(x) in _NUMBERS for x in self.value):
+                out = [float(x) for x in self.value]
+            else:
+                out = None
+
+            if out is not None:
+                for child in self.children:
+                    child.fit_success = True
+
+                self.fit_success = True
+                return out
+
+        if _container_kind(item_t) == _KIND_OBJECT:
+            out = self.fit_objects(item_t)
+
+            if out is not None:
+                self.fit_success = True
+                return out
+
         failed = False
         out = []
+        fit_node = self.fitter.fit_node_fast
 
         for child in self.children:
             try:
-                out.append(self.fitter.fit_node(args[0], child))
+                out.append(fit_node(item_t, child))
             except ValueError:
                 failed = True
 
@@ -595,8 +836,76 @@ class ListNode(Node):
         self.fit_success = True
         return out
 
+    def fit_objects(self, t: Type[T]) -> Optional[List[T]]:
+        """
+        Fast path for lists of objects which all have the same keys. Instead
+        of fitting each object one by one, each field is fitted as a column
+        across all the objects, which means that the type of the field is
+        only routed once per column when it's a flat type.
+
+        This only works for the simple cases (no metadata on the fields and
+        no missing or unwanted keys). When it returns ``None``, nothing is
+        left behind and the regular fitting must be done, which will also
+        take care of the error reporting.
+
+        Parameters
+        ----------
+        t
+            Named tuple or dataclass to fit each item into
+        """
+
+        children = self.children
+
+        if not children or any(c.__class__ is not MappingNode for c in children):
+            return None
+
+        plan = get_fit_plan(t)
+
+        if plan.sources or plan.contexts or plan.root_fields:
+            return None
+
+        keys = children[0].children.keys()
+
+        if (
+            not keys
+            or not keys <= plan.expected
+            or not plan.required <= keys
+            or not keys <= plan.hints.keys()
+            or any(c.children.keys() != keys for c in children)
+        ):
+            return None
+
+        injectors = self.fitter.root_injectors
+        start = len(injectors)
+        fit_node = self.fitter.fit_node_fast
+        names = tuple(keys)
+        columns = []
 
-@dataclass
+        try:
+            for name in names:
+                hint = plan.hints[name]
+                nodes = [c.children[name] for c in children]
+
+                if _is_flat_type(hint) and all(type(n.value) is hint for n in nodes):
+                    for node in nodes:
+                        node.fit_success = True
+
+                    columns.append([n.value for n in nodes])
+                else:
+                    columns.append([fit_node(hint, n) for n in nodes])
+
+            out = [t(**dict(zip(names, row))) for row in zip(*columns)]
+        except ValueError:
+            del injectors[start:]
+            return None
+
+        for child in children:
+            child.fit_success = True
+
+        return out
+
+
+@dataclass(slots=True)
 class FlatNode(Node):
     """
     Flat nodes are mostly the builtin types (int, float, str, bool, None) but
@@ -655,25 +964,17 @@ class FlatNode(Node):
         if t is list:
             self.fail(f"{format_type_name(t)} can only fit a list")
 
-        try:
-            sig = signature(t).bind(self.value)
-        except TypeError:
-            self.fail(
-                "Constructor should be callable with exactly 1 positional argument"
-            )
-
-        (param_name,) = sig.arguments
-        param: Parameter = sig.signature.parameters[param_name]
+        annotation, error = _flat_class_plan(t)
 
-        if param.annotation is param.empty:
-            self.fail("Constructor does not specify argument type")
+        if error:
+            self.fail(error)
 
         try:
-            arg = self.fitter.fit(param.annotation, self.value)
+            arg = self.fitter.fit(annotation, self.value)
         except ValueError:
             self.fail(
                 f"Constructor {format_type_name(t)} expects "
-                f"{param.annotation} but value does not fit"
+                f"{annotation} but value does not fit"
             )
 
         return t(arg)
@@ -701,7 +1002,7 @@ class FlatNode(Node):
         return out
 
 
-@dataclass
+@dataclass(slots=True)
 class LiteralNode(Node):
     """
     This kind of node is used to inject a literal value that we don't want to
@@ -1,18 +1,47 @@
 import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from logging import ERROR, getLogger
-from typing import Iterator, List, Text
-
-from pygments import highlight
-from pygments.formatters import get_formatter_by_name
-from pygments.lexers.javascript import JavascriptLexer
+from typing import Any, Dict, List, Text, Tuple, Union
 
 from .nodes import *
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = getLogger("typefit")
 
 
+def _dumps(value: Any) -> Text:
+    """
+    Encodes a flat JSON value. Strings, which are the bulk of what gets
+    displayed, are encoded by orjson when it is installed. Other values go
+    through the standard library to keep its exact output (NaN, big ints,
+    etc).
+    """
+
+    if orjson is not None and value.__class__ is str:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            pass
+
+    return json.dumps(value, ensure_ascii=False)
+
+
+@lru_cache(maxsize=4096)
+def _dumps_key(key: Any) -> Text:
+    """
+    Encodes a mapping key. Keys are mostly the same few field names over and
+    over, hence the cache.
+    """
+
+    return json.dumps(key)
+
+
 class ErrorFormatter(ABC):
     """
     This interface is in charge of converting the meta information from
@@ -84,7 +113,7 @@ class LogErrorReporter(ErrorReporter):
         logger.log(self.level, "Fitting error:\n\n%s", self.formatter.format(node))
 
 
-@dataclass
+@dataclass(slots=True)
 class _Line:
     """
     Internal utility class to represent a line that might have errors above
@@ -100,6 +129,18 @@ class _Line:
     errors: List[Text] = field(default_factory=list)
 
 
+# Formatters output either lines or a (node, level, prefix, suffix) tuple of a
+# child node to be formatted at this position
+_Item = Union[_Line, Tuple[Node, int, Text, Text]]
+
+# Name of the PrettyJson5Formatter method in charge of each kind of node
+_FORMAT_METHOD = {
+    FlatNode: "_format_flat",
+    ListNode: "_format_list",
+    MappingNode: "_format_mapping",
+}
+
+
 class PrettyJson5Formatter(ErrorFormatter):
     """
     Formats the data into annotated and redacted JSON5. The goal here is to
@@ -132,17 +173,40 @@ class PrettyJson5Formatter(ErrorFormatter):
         self.colors = colors
         self.truncate_strings_at = truncate_strings_at
         self._previous_level = -1
+        self._indent_cache = [""]
+        self._comment_cache = {}
+        self._lexer = None
+        self._formatter = None
 
     def _indent(self, level: int) -> Text:
         """
-        Generates the indent for the given indent level
+        Generates the indent for the given indent level. Indents are cached
+        since there is only as many of them as there are depth levels.
         """
 
-        return self.indent * level
+        cache = self._indent_cache
+
+        while len(cache) <= level:
+            cache.append(cache[-1] + self.indent)
 
-    def _line(self, line: _Line) -> Text:
+        return cache[level]
+
+    def _comment(self, level: int) -> Text:
+        """
+        Generates the beginning of an error comment at the given indent level,
+        which is cached for the same reason as :py:meth:`~._indent`.
         """
-        Generates the output for a given line.
+
+        try:
+            return self._comment_cache[level]
+        except KeyError:
+            out = self._comment_cache[level] = f"{self._indent(level)}// "
+            return out
+
+    def _line(self, line: _Line, parts: List[Text]) -> None:
+        """
+        Generates the output for a given line, as chunks of text appended to
+        the parts of the whole output.
 
         Notes
         -----
@@ -155,23 +219,31 @@ class PrettyJson5Formatter(ErrorFormatter):
         ----------
         line
             Line to print
+        parts
+            Chunks of the output, to be joined once everything is generated
         """
 
-        out = "\n".join(
-            [
-                *([""] if line.errors and line.level == self._previous_level else []),
-                *(f"{self._indent(line.level)}// {e}" for e in line.errors),
-                f"{self._indent(line.level)}{line.content}",
-            ]
-        )
+        indent = self._indent(line.level)
 
-        self._previous_level = line.level
+        if line.errors and line.level == self._previous_level:
+            parts.append("\n")
 
-        return out
+        if line.errors:
+            comment = self._comment(line.level)
+
+            for error in line.errors:
+                parts.append(comment)
+                parts.append(error)
+                parts.append("\n")
+
+        parts.append(indent)
+        parts.append(line.content)
+
+        self._previous_level = line.level
 
     def _format_flat(
         self, node: FlatNode, level: int, prefix: Text, suffix: Text
-    ) -> Iterator[_Line]:
+    ) -> List[_Item]:
         """
         Formats a flat literal using the standard JSON function.
 
@@ -192,18 +264,21 @@ class PrettyJson5Formatter(ErrorFormatter):
             value = node.value
             extra = ""
 
-        out = _Line(
-            level, f"{prefix}{json.dumps(value, ensure_ascii=False)}{extra}{suffix}"
-        )
+        content = _dumps(value)
+
+        if prefix or extra or suffix:
+            content = f"{prefix}{content}{extra}{suffix}"
+
+        out = _Line(level, content)
 
         if not node.fit_success:
             out.errors.extend(node.errors)
 
-        yield out
+        return [out]
 
     def _format_list(
         self, node: ListNode, level: int, prefix: Text, suffix: Text
-    ) -> Iterator[_Line]:
+    ) -> List[_Item]:
         """
         Formats a list. Same logic as :py:meth:`~._format_mapping` except for
         lists.
@@ -215,36 +290,34 @@ class PrettyJson5Formatter(ErrorFormatter):
             else:
                 content = ""
 
-            yield _Line(level, f"{prefix}[{content}]{suffix}", [*node.errors])
-        else:
-            yield _Line(level, f"{prefix}[", [*node.errors])
+            return [_Line(level, f"{prefix}[{content}]{suffix}", [*node.errors])]
+
+        out: List[_Item] = [_Line(level, f"{prefix}[", [*node.errors])]
 
-            errors = set()
-            to_display = []
+        to_display: Dict[Tuple[Text, ...], Node] = {}
 
-            for child in node.children:
-                child_errors = tuple(child.errors)
+        for child in node.children:
+            if not child.fit_success:
+                to_display.setdefault(tuple(child.errors), child)
 
-                if not child.fit_success and child_errors not in errors:
-                    errors.add(child_errors)
-                    to_display.append(child)
+        for child in to_display.values():
+            out.append((child, level + 1, "", ","))
 
-            for child in to_display:
-                yield from self._format(child, level + 1, "", ",")
+        out.append(_Line(level, f"]{suffix}"))
 
-            yield _Line(level, f"]{suffix}")
+        return out
 
     def _format_mapping(
         self, node: MappingNode, level: int, prefix: Text, suffix: Text
-    ) -> Iterator[_Line]:
+    ) -> List[_Item]:
         """
         Formats a mapping.
 
         - If the problem is not in the kids (maybe an int was expected and an
           object was received, by example) then just abreviate the object and
           put the error on top
-        - If the problem is with the kids, recursively renders the kids to
-          help the developer figuring out which kid is misbehaving
+        - If the problem is with the kids, renders the kids as well to help
+          the developer figuring out which kid is misbehaving
         """
 
         if not node.problem_is_kids:
@@ -253,28 +326,31 @@ class PrettyJson5Formatter(ErrorFormatter):
             else:
                 content = ""
 
-            yield _Line(level, f"{prefix}{{{content}}}{suffix}", [*node.errors])
-        else:
-            yield _Line(level, f"{prefix}{{", [*node.errors])
+            return [_Line(level, f"{prefix}{{{content}}}{suffix}", [*node.errors])]
+
+        out: List[_Item] = [_Line(level, f"{prefix}{{", [*node.errors])]
 
-            for key, child in node.children.items():
-                yield from self._format(child, level + 1, f"{json.dumps(key)}: ", ",")
+        for key, child in node.children.items():
+            out.append((child, level + 1, f"{_dumps_key(key)}: ", ","))
 
-            if node.missing_keys:
-                yield _Line(
+        if node.missing_keys:
+            out.append(
+                _Line(
                     level + 1,
                     f'// Missing keys: {", ".join(repr(k) for k in node.missing_keys)}',
                 )
+            )
+
+        out.append(_Line(level, f"}}{suffix}"))
 
-            yield _Line(level, f"}}{suffix}")
+        return out
 
     def _format(
         self, node: Node, level: int = 0, prefix: Text = "", suffix: Text = ""
-    ) -> Iterator[_Line]:
+    ) -> List[_Line]:
         """
-        Will recursively generate the format of a line. Depending on the node
-        type, the right formatter will be chosen and all the generated lines
-        will be iterated.
+        Generates all the lines of a node and its children. Depending on the
+        node type, the right formatter will be chosen.
 
         Notes
         -----
@@ -283,6 +359,11 @@ class PrettyJson5Formatter(ErrorFormatter):
         knowing beforehand where the line is going to be displayed or if it's
         the first/last line.
 
+        Formatters don't recurse into the children. Instead, they return the
+        children to be formatted in between their own lines and the tree is
+        walked here using an explicit stack. This avoids piling up nested
+        generators on deep trees.
+
         Parameters
         ----------
         node
@@ -301,27 +382,57 @@ class PrettyJson5Formatter(ErrorFormatter):
         _format_mapping
         """
 
-        # noinspection PyTypeChecker
-        yield from {
-            FlatNode: self._format_flat,
-            ListNode: self._format_list,
-            MappingNode: self._format_mapping,
-        }[node.__class__](node, level, prefix, suffix)
+        out: List[_Line] = []
+        stack: List[_Item] = [(node, level, prefix, suffix)]
+
+        while stack:
+            item = stack.pop()
+
+            if isinstance(item, _Line):
+                out.append(item)
+            else:
+                # noinspection PyTypeChecker
+                formatter = getattr(self, _FORMAT_METHOD[item[0].__class__])
+                stack.extend(reversed(formatter(*item)))
+
+        return out
 
     def format(self, node: "Node") -> Text:
         """
         Formats the node into JSON5. If colors were specified in the
         constructor, then it's also where the coloration is added before being
         returned.
+
+        Notes
+        -----
+        Pygments is only imported when colors are required since it's fairly
+        heavy to import. The lexer and formatter are created on first use and
+        then kept for subsequent reports.
+
+        All the lines are generated as chunks into a single list, which is
+        joined once at the end.
         """
 
-        out = "\n".join(map(self._line, self._format(node)))
-        formatter = None
+        parts = []
+
+        for i, line in enumerate(self._format(node)):
+            if i:
+                parts.append("\n")
+
+            self._line(line, parts)
+
+        out = "".join(parts)
 
         if self.colors:
-            formatter = get_formatter_by_name(self.colors)
+            from pygments import highlight
+
+            if self._formatter is None:
+                from pygments.formatters import get_formatter_by_name
+                from pygments.lexers.javascript import JavascriptLexer
+
+                self._formatter = get_formatter_by_name(self.colors)
+                self._lexer = JavascriptLexer()
 
-        if formatter:
-            out = highlight(out, JavascriptLexer(), formatter)
+            out = highlight(out, self._lexer, self._formatter)
 
         return out
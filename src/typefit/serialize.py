@@ -1,12 +1,108 @@
-from collections import ChainMap, abc
-from dataclasses import fields, is_dataclass
+from collections import abc
+from dataclasses import is_dataclass
 from datetime import date, datetime
 from enum import Enum
+from functools import lru_cache
 from json import dumps
-from typing import Any, get_type_hints
+from keyword import iskeyword
+from types import MappingProxyType
+from typing import AbstractSet, Any, Callable, Dict, Mapping, Optional, Tuple
 from uuid import UUID
+from weakref import WeakKeyDictionary
 
-from .meta import Source
+from .meta import Source, field_plans, other_field_key
+from .utils import type_cache, type_hints
+
+_PRIMITIVES = frozenset([int, float, bool, str, type(None)])
+
+
+@type_cache
+def _tuple_keys(cls: type) -> Tuple[str, ...]:
+    """
+    Annotated fields of a named tuple class. Resolving type hints is costly
+    so it's only done once per class.
+    """
+
+    return tuple(type_hints(cls))
+
+
+@type_cache
+def _dataclass_fields(cls: type) -> Tuple[Tuple[str, Optional[Source]], ...]:
+    """
+    Fields of a dataclass that have to be serialized, along with their source
+    if they have one. Injected fields are skipped since they don't come from
+    the JSON structure. This only depends on the class so it's done once.
+    """
+
+    return tuple(
+        (plan.name, plan.source)
+        for plan in field_plans(cls)
+        if plan.context is None and not plan.inject_root
+    )
+
+
+@lru_cache(maxsize=None)
+def _make_fields_serializer(
+    items: Tuple[Tuple[str, str], ...],
+) -> Optional[Callable[[Any, Callable[[Any], Any]], Dict[str, Any]]]:
+    """
+    Generates the code of a function that serializes the given attributes of
+    an object into a dictionary, just as it would be written by hand. This
+    avoids looping over fields at runtime for objects serialized many times.
+
+    Returns None if the names can't be written as attributes in Python code.
+
+    Parameters
+    ----------
+    items
+        Pairs of output key and attribute to serialize into this key. If
+        several attributes go into the same key, the first one wins.
+    """
+
+    if not all(attr.isidentifier() and not iskeyword(attr) for _, attr in items):
+        return None
+
+    keys = {}
+
+    for key, attr in items:
+        keys.setdefault(key, attr)
+
+    code = "".join(f"{key!r}: serialize(obj.{attr}), " for key, attr in keys.items())
+    namespace = {}
+
+    exec(  # noqa: S102
+        f"def serialize_fields(obj, serialize):\n    return {{{code}}}\n",
+        namespace,
+    )
+
+    return namespace["serialize_fields"]
+
+
+@type_cache
+def _compiled_serializer(
+    cls: type,
+) -> Optional[Callable[[Any, Callable[[Any], Any]], Dict[str, Any]]]:
+    """
+    Generated serializer for a named tuple or dataclass (see
+    :py:func:`~._make_fields_serializer`). Dataclasses with sourced fields
+    can only be compiled if all the sources come from
+    :py:func:`~.typefit.meta.other_field`, otherwise this returns None.
+    """
+
+    if is_dataclass(cls):
+        items = []
+
+        for name, source in _dataclass_fields(cls):
+            if source is None:
+                items.append((name, name))
+            elif (key := other_field_key(source)) is not None:
+                items.append((key, name))
+            else:
+                return None
+    else:
+        items = [(name, name) for name in _tuple_keys(cls)]
+
+    return _make_fields_serializer(tuple(items))
 
 
 class Serializer:
@@ -46,6 +142,14 @@ class Serializer:
     SaneSerializer
     """
 
+    # Caches of _type_serializer(), created on the instance when something is
+    # first stored so that subclasses don't have to call __init__(). Builtin
+    # types are kept in a plain dictionary for speed while other classes are
+    # weakly referenced, since they might be created on the fly.
+    _serializers: Mapping[type, Callable[[Any], Any]] = MappingProxyType({})
+    _class_serializers: Mapping[type, Callable[[Any], Any]] = MappingProxyType({})
+    _untouched: AbstractSet[type] = frozenset()
+
     def find_serializer(self, obj: Any):
         """
         Trying to be as generic as possible. There is a few tricks there, like
@@ -55,6 +159,13 @@ class Serializer:
         Please override this if you want to change the behavior. See how it's
         done in :py:class:`~.typefit.serialize.SaneSerializer` for an idea
         on how to do it.
+
+        Notes
+        -----
+        The result is cached by :py:meth:`~.serialize` for the type of the
+        object, so the decision should only depend on the object's type. For
+        the same reason, `__typefit_serialize__()` has to be defined on the
+        class rather than set on an instance.
         """
 
         if hasattr(obj, "__typefit_serialize__"):
@@ -85,16 +196,40 @@ class Serializer:
         as a reference to get the fields list, however types are not enforced.
         """
 
-        return {
-            k: self.serialize(getattr(obj, k)) for k in get_type_hints(obj.__class__)
-        }
+        if compiled := _compiled_serializer(obj.__class__):
+            return compiled(obj, self.serialize)
+
+        return {k: self.serialize(getattr(obj, k)) for k in _tuple_keys(obj.__class__)}
 
     def serialize_sequence(self, obj: abc.Sequence):
         """
         Sequences are converted to regular lists, and each item of the list
         is recursively serialized.
+
+        Notes
+        -----
+        When all items are of the same type, their serializer is only looked
+        up once. Lists and tuples made only of one primitive type that would
+        be left untouched anyway are simply copied. None of this happens if
+        :py:meth:`~.serialize` is overridden, since it has to be called for
+        each item.
         """
 
+        if (
+            (obj.__class__ is list or obj.__class__ is tuple)
+            and obj
+            and self.__class__.serialize is _SERIALIZE
+        ):
+            t = obj[0].__class__
+
+            if all(x.__class__ is t for x in obj):
+                serializer = self._type_serializer(obj[0])
+
+                if t in self._untouched:
+                    return list(obj)
+
+                return [serializer(x) for x in obj]
+
         return [self.serialize(x) for x in obj]
 
     def serialize_typefit(self, obj: Any):
@@ -114,27 +249,30 @@ class Serializer:
         -----
         See :py:class:`~.typefit.meta.Source`, but basically the conversion to
         JSON structure generates a series of dictionaries that are then
-        superposed into a single dictionary and returned.
+        superposed into a single dictionary and returned. If several fields
+        produce the same key, the first one wins.
 
         All values of this dictionary are of course recursively serialized.
+
+        When all the sources are known to read another key (like
+        :py:func:`~.typefit.meta.other_field`), a function specialized for
+        the class is generated and used instead (same goes for named tuples).
         """
 
-        def _get_values():
-            for field in fields(obj.__class__):
-                source: Source
+        if compiled := _compiled_serializer(obj.__class__):
+            return compiled(obj, self.serialize)
+
+        out = {}
 
-                match (field.metadata):
-                    case {"typefit_source": source}:
-                        yield {
-                            k: self.serialize(v)
-                            for k, v in source.value_to_json(field.name, obj).items()
-                        }
-                    case {"typefit_inject_root": True} | {"typefit_from_context": _}:
-                        pass
-                    case _:
-                        yield {field.name: self.serialize(getattr(obj, field.name))}
+        for name, source in _dataclass_fields(obj.__class__):
+            if source:
+                for k, v in source.value_to_json(name, obj).items():
+                    if k not in out:
+                        out[k] = self.serialize(v)
+            elif name not in out:
+                out[name] = self.serialize(getattr(obj, name))
 
-        return dict(ChainMap(*_get_values()))
+        return out
 
     def serialize_mapping(self, obj: abc.Mapping):
         """
@@ -164,7 +302,8 @@ class Serializer:
         This method relies on the :py:meth:`~.Serializer.find_serializer()`
         method, which means that if you implement a subclass in order to
         change the mapping of serialization functions you should override
-        :py:meth:`~.Serializer.find_serializer()`.
+        :py:meth:`~.Serializer.find_serializer()`. Its result is remembered
+        for each type of object.
 
         Parameters
         ----------
@@ -172,16 +311,84 @@ class Serializer:
             Object to be serialized
         """
 
-        serializer = self.find_serializer(obj)
+        t = obj.__class__
+
+        if t in self._untouched:
+            return obj
+
+        if (serializer := self._serializers.get(t)) is None:
+            serializer = self._type_serializer(obj)
+
         return serializer(obj)
 
+    def _type_serializer(self, obj: Any) -> Callable[[Any], Any]:
+        """
+        Cached version of :py:meth:`~.find_serializer`, based on the type of
+        the object. The `__typefit_serialize__()` method is looked up on the
+        type as well, which spares a failing attribute lookup on every object
+        that doesn't have it.
+
+        Primitive types that end up with
+        :py:meth:`~.serialize_generic` are remembered as such, so that
+        :py:meth:`~.serialize` can return them as-is without a call. This is
+        decided on the exact type so subclasses (of int by example) still go
+        through their own serializer, and only if
+        :py:meth:`~.serialize_generic` isn't overridden.
+        """
+
+        t = obj.__class__
+
+        try:
+            return self._serializers[t]
+        except KeyError:
+            pass
+
+        try:
+            return self._class_serializers[t]
+        except KeyError:
+            pass
+
+        if getattr(t, "__typefit_serialize__", None) is not None:
+            serializer = self.serialize_typefit
+        else:
+            serializer = self.find_serializer(obj)
+
+        if "_serializers" not in self.__dict__:
+            self._serializers = {}
+            self._class_serializers = WeakKeyDictionary()
+            self._untouched = set()
+
+        if t.__module__ == "builtins":
+            self._serializers[t] = serializer
+        else:
+            self._class_serializers[t] = serializer
+
+        if (
+            t in _PRIMITIVES
+            and getattr(serializer, "__func__", None) is Serializer.serialize_generic
+        ):
+            self._untouched.add(t)
+
+        return serializer
+
     def json(self, obj: Any) -> str:
         """
         Shortcut to transform an object into a JSON string going through
         :py:meth:`~.serialize`.
+
+        Notes
+        -----
+        The output of :py:meth:`~.serialize` is a tree of fresh containers, so
+        the encoder doesn't need to keep track of them in order to detect
+        circular references (a circular input would already have failed).
         """
 
-        return dumps(self.serialize(obj))
+        return dumps(self.serialize(obj), check_circular=False)
+
+
+# Base implementation of Serializer.serialize(), shortcuts that don't call it
+# for each item are only taken when it is not overridden
+_SERIALIZE = Serializer.serialize
 
 
 class SaneSerializer(Serializer):
@@ -231,6 +438,10 @@ class SaneSerializer(Serializer):
         return obj.isoformat()
 
 
+# Shared by calls to serialize() so that its caches are kept between calls
+_sane_serializer = SaneSerializer()
+
+
 def serialize(obj: Any) -> Any:
     """
     Shortcut to use the :py:class:`~.typefit.serialize.SaneSerializer`'s
@@ -242,4 +453,4 @@ def serialize(obj: Any) -> Any:
         Object to be serializer
     """
 
-    return SaneSerializer().serialize(obj)
+    return _sane_serializer.serialize(obj)
@@ -1,36 +1,71 @@
 import re
 from collections import abc
+from functools import lru_cache, wraps
 from inspect import Parameter, isclass, signature
 from string import Formatter
-from typing import Any, Callable, Dict, Generic, Iterator, Text, TypeVar
-from urllib.parse import quote_plus
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Text,
+    Tuple,
+    TypeVar,
+    get_type_hints,
+)
+from weakref import WeakKeyDictionary
 
 CLASS_RE = re.compile(r"<class '([^']+)'>")
 
+# Everything that is not an unreserved character (RFC 3986) has to be escaped
+URL_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_.~-]+")
+
 T = TypeVar("T")
 
 
-def loose_call(func: Callable, kwargs: Dict[Text, Any]):
+def _signature_keys(func: Callable) -> Tuple[bool, FrozenSet[Text]]:
     """
-    Calls a function using only kwargs and drops extra parameters that are not
-    required if there is no kwargs argument to collect extra arguments.
+    Inspects the signature of a function to know whether it accepts arbitrary
+    keyword arguments and what are the names of its parameters.
     """
 
     sig = signature(func)
 
-    has_kwargs = False
+    has_kwargs = any(
+        param.kind == Parameter.VAR_KEYWORD for param in sig.parameters.values()
+    )
 
-    for param in sig.parameters.values():
-        if param.kind == Parameter.VAR_KEYWORD:
-            has_kwargs = True
+    return has_kwargs, frozenset(sig.parameters.keys())
 
-    if not has_kwargs:
-        expect = set(sig.parameters.keys())
-        present = set(kwargs.keys())
 
-        return func(**{k: kwargs[k] for k in (expect & present)})
-    else:
+_signature_keys_cached = lru_cache(maxsize=1024)(_signature_keys)
+
+
+def loose_call(func: Callable, kwargs: Dict[Text, Any]):
+    """
+    Calls a function using only kwargs and drops extra parameters that are not
+    required if there is no kwargs argument to collect extra arguments.
+
+    Notes
+    -----
+    The signature inspection is cached per function since it is quite
+    expensive and the same functions are called over and over.
+    """
+
+    try:
+        has_kwargs, expect = _signature_keys_cached(func)
+    except TypeError:
+        has_kwargs, expect = _signature_keys(func)
+
+    if has_kwargs or kwargs.keys() == expect:
         return func(**kwargs)
+    else:
+        return func(**{k: kwargs[k] for k in (kwargs.keys() & expect)})
 
 
 def callable_value(value, kwargs):
@@ -43,6 +78,40 @@ def callable_value(value, kwargs):
     return value
 
 
+@lru_cache(maxsize=1024)
+def _quote_chunk(chunk: Text) -> Text:
+    """
+    Percent-encodes a chunk of unsafe characters (spaces become "+")
+    """
+
+    return "".join("+" if b == 0x20 else f"%{b:02X}" for b in chunk.encode())
+
+
+def url_quote(value: Text) -> Text:
+    """
+    Same output as :py:func:`urllib.parse.quote_plus` (with no safe
+    characters) but only the unsafe parts of the string get looked at, in a
+    single regex pass.
+
+    Parameters
+    ----------
+    value
+        String to be escaped
+    """
+
+    return URL_UNSAFE_RE.sub(lambda m: _quote_chunk(m.group()), value)
+
+
+@lru_cache(maxsize=1024)
+def _parse_format(format_string: Text) -> Tuple[Tuple, ...]:
+    """
+    Cached version of :py:meth:`string.Formatter.parse`, as the same paths get
+    formatted over and over.
+    """
+
+    return tuple(Formatter().parse(format_string))
+
+
 class UrlFormatter(Formatter):
     """
     Just like a regular formatter except that all formatted variables are
@@ -50,10 +119,60 @@ class UrlFormatter(Formatter):
     @get("items/{item_id}.json") without worrying about escaping the ID.
     """
 
+    def parse(self, format_string):
+        return _parse_format(format_string)
+
     def format_field(self, value, format_spec):
         out = super().format_field(value, format_spec)
-        out = quote_plus(f"{out}")
-        return out
+        return url_quote(f"{out}")
+
+
+_CONVERSIONS = {None: "", "r": "repr", "s": "str", "a": "ascii"}
+
+
+@lru_cache(maxsize=1024)
+def compile_url(template: Text) -> Callable[[Mapping[Text, Any]], Text]:
+    """
+    Generates a function that formats the URL template just like
+    :py:class:`~.UrlFormatter` would, with the template being parsed once
+    instead of at each call. By example, ``get?value={value}`` becomes
+
+    >>> def format_url(kwargs):
+    >>>     return "".join(["get?value=", quote(format(kwargs["value"], ""))])
+
+    Templates using features that the generated code doesn't handle (like
+    attributes or positional fields) are formatted by a
+    :py:class:`~.UrlFormatter` instead.
+
+    Parameters
+    ----------
+    template
+        URL template to be compiled
+    """
+
+    parts = []
+
+    for literal, name, spec, conversion in _parse_format(template):
+        if literal:
+            parts.append(repr(literal))
+
+        if name is None:
+            continue
+
+        if not name.isidentifier() or "{" in spec or conversion not in _CONVERSIONS:
+            return lambda kwargs: UrlFormatter().vformat(template, (), kwargs)
+
+        value = f"{_CONVERSIONS[conversion]}(kwargs[{name!r}])"
+        parts.append(f"quote(format({value}, {spec!r}))")
+
+    namespace = {"quote": url_quote}
+
+    exec(  # noqa: S102
+        f"def format_url(kwargs):\n    return ''.join([{', '.join(parts)}])\n",
+        namespace,
+    )
+
+    return namespace["format_url"]
 
 
 def is_named_tuple(value: Any) -> bool:
@@ -65,6 +184,71 @@ def is_named_tuple(value: Any) -> bool:
     return test(value, tuple) and hasattr(value, "_fields")
 
 
+def type_cache(func: Callable[[Any], T]) -> Callable[[Any], T]:
+    """
+    Caches the result of a function which takes a type as only argument.
+    Types are weakly referenced, so that classes created on the fly (like in
+    a function) can still be garbage-collected once they're used. Types that
+    can't be weakly referenced (like ``int | None``) go into a bounded cache
+    instead.
+
+    As with :py:func:`functools.lru_cache`, a TypeError is raised if the type
+    can't be hashed.
+
+    Parameters
+    ----------
+    func
+        Function to cache
+    """
+
+    weak: "WeakKeyDictionary[Any, T]" = WeakKeyDictionary()
+    bounded = lru_cache(maxsize=1024)(func)
+
+    @wraps(func)
+    def wrapper(t: Any) -> T:
+        try:
+            return weak[t]
+        except KeyError:
+            out = weak[t] = func(t)
+            return out
+        except TypeError:
+            return bounded(t)
+
+    return wrapper
+
+
+def type_hints(cls: type) -> Dict[Text, Any]:
+    """
+    Resolved type hints of a class. Resolving them is costly (forward
+    references have to be evaluated) so the result is stored on the class
+    itself as ``__typefit_hints__``, and read from there afterwards.
+
+    Notes
+    -----
+    A class can also define ``__typefit_hints__`` by itself, by example if
+    some of its annotations can't be resolved at runtime. Only the class's own
+    attribute is considered, hints of a parent class don't apply to its
+    children.
+
+    Parameters
+    ----------
+    cls
+        Class whose hints are needed
+    """
+
+    hints = cls.__dict__.get("__typefit_hints__")
+
+    if hints is None:
+        hints = get_type_hints(cls)
+
+        try:
+            setattr(cls, "__typefit_hints__", hints)
+        except (AttributeError, TypeError):
+            pass
+
+    return hints
+
+
 class OrderedSet(Generic[T], abc.MutableSet):
     """
     Behaves exactly like a set() except that the objects will be kept in order
@@ -72,21 +256,32 @@ class OrderedSet(Generic[T], abc.MutableSet):
 
     Notes
     -----
-    Internally it relies on dictionaries keeping order. This means that this
-    will only work for Python 3.7+ (and CPython 3.6+).
+    Internally this wraps a dictionary whose keys are the items of the set, so
+    that order is kept. The dictionary is not exposed (it would otherwise make
+    the set look like a mapping), however the operations producing a new set
+    are done directly on dictionaries rather than item by item.
     """
 
-    def __init__(self, initial_data: Iterator[T] = tuple()):
-        self._set = {k: True for k in initial_data}
+    __slots__ = ("_set",)
+
+    def __init__(self, initial_data: Optional[Iterable[T]] = None):
+        self._set: Dict[T, None] = (
+            {} if initial_data is None else dict.fromkeys(initial_data)
+        )
 
     def add(self, x: T) -> None:
-        self._set[x] = True
+        self._set[x] = None
 
     def discard(self, x: T) -> None:
-        try:
-            del self._set[x]
-        except KeyError:
-            pass
+        self._set.pop(x, None)
+
+    def clear(self) -> None:
+        self._set.clear()
+
+    def copy(self) -> "OrderedSet[T]":
+        return self._from_dict(self._set)
+
+    __copy__ = copy
 
     def __contains__(self, x: object) -> bool:
         return x in self._set
@@ -95,19 +290,80 @@ class OrderedSet(Generic[T], abc.MutableSet):
         return len(self._set)
 
     def __iter__(self) -> Iterator[T]:
-        yield from self._set
+        return iter(self._set)
+
+    def __repr__(self) -> Text:
+        return f"{self.__class__.__name__}([{', '.join(repr(x) for x in self)}])"
+
+    def _from_dict(self, data: Dict[T, None]) -> "OrderedSet[T]":
+        """
+        Creates a new set directly from a dictionary of keys, which avoids
+        going through the items one by one.
+        """
+
+        out = self.__class__()
+        out._set.update(data)
+        return out
+
+    def __or__(self, other: Iterable[T]) -> "OrderedSet[T]":
+        if not isinstance(other, abc.Iterable):
+            return NotImplemented
+
+        return self._from_dict({**self._set, **dict.fromkeys(other)})
+
+    def __and__(self, other: Iterable[T]) -> "OrderedSet[T]":
+        if not isinstance(other, abc.Iterable):
+            return NotImplemented
+
+        if not isinstance(other, abc.Set):
+            other = dict.fromkeys(other)
+
+        return self._from_dict({k: None for k in self._set if k in other})
+
+    def __sub__(self, other: Iterable[T]) -> "OrderedSet[T]":
+        if not isinstance(other, abc.Iterable):
+            return NotImplemented
+
+        if not isinstance(other, abc.Set):
+            other = dict.fromkeys(other)
+
+        return self._from_dict({k: None for k in self._set if k not in other})
 
 
 def format_type_name(t: Any) -> Text:
     """
     Heuristics to make a type name look nice. It might change in the future.
 
+    Notes
+    -----
+    Results are cached since types are immutable in practice. Unhashable
+    types (like a Literal of a list) are simply formatted without cache.
+
     Parameters
     ----------
     t
         Type whose name you want to format
     """
 
+    try:
+        return _format_type_name_cached(t)
+    except TypeError:
+        return _format_type_name(t)
+
+
+def _format_type_name(t: Any) -> Text:
+    """
+    Actual implementation of :py:func:`~.format_type_name`
+    """
+
+    if type(t) is type:
+        if t is type(None):
+            return "'None'"
+        elif t.__module__ == "builtins":
+            return f"'{t.__qualname__}'"
+        else:
+            return f"'{t.__module__}.{t.__qualname__}'"
+
     out = f"{t}"
 
     m = CLASS_RE.match(out)
@@ -119,3 +375,6 @@ def format_type_name(t: Any) -> Text:
         out = "'None'"
 
     return out
+
+
+_format_type_name_cached = type_cache(_format_type_name)
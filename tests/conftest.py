@@ -0,0 +1,31 @@
+import httpx
+from pytest import fixture
+
+from .issue_000004.httpbin_utils import HttpBin, find_free_port
+
+
+@fixture(name="http", scope="session")
+def make_http():
+    with httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=30.0,
+    ) as client:
+        yield client
+
+
+@fixture(name="bin_url", scope="session")
+def make_bin_url():
+    """
+    A single httpbin is started for the whole session. When running with
+    pytest-xdist, each worker has its own session, hence its own httpbin on
+    its own free port.
+    """
+
+    port = find_free_port()
+    hb = HttpBin(port)
+    hb.run()
+
+    try:
+        yield f"http://127.0.0.1:{port}/"
+    finally:
+        hb.stop()
@@ -15,6 +15,46 @@ def test_date_time():
         assert narrows.DateTime("xxx")
 
 
+def test_date_time_cache():
+    assert narrows.DateTime("2019-01-01T00:00:00Z") is narrows.DateTime(
+        "2019-01-01T00:00:00Z"
+    )
+
+    for _ in range(2):
+        with raises(ValueError):
+            narrows.DateTime("xxx")
+
+
+def test_date_time_cache_error_type():
+    for _ in range(2):
+        with raises(pendulum.parsing.exceptions.ParserError):
+            narrows.DateTime("yyy")
+
+
+def test_date_time_cache_time_only():
+    with pendulum.test(pendulum.datetime(2020, 1, 1)):
+        assert narrows.DateTime("12:00") == pendulum.datetime(2020, 1, 1, 12)
+
+    with pendulum.test(pendulum.datetime(2020, 1, 2)):
+        assert narrows.DateTime("12:00") == pendulum.datetime(2020, 1, 2, 12)
+        assert narrows.Date("12:00") == pendulum.date(2020, 1, 2)
+
+
+def test_cache_size(monkeypatch):
+    calls = []
+
+    def parse(value):
+        calls.append(value)
+        return value
+
+    monkeypatch.setattr(narrows, "CACHE_SIZE", 0)
+    memoized = narrows._memoize(parse)
+
+    assert memoized("a") == "a"
+    assert memoized("a") == "a"
+    assert calls == ["a", "a"]
+
+
 def test_date():
     assert narrows.Date("2019-01-01") == pendulum.parse("2019-01-01").date()
 
@@ -1,54 +1,40 @@
 import socket
-import time
-from multiprocessing import Process
-from typing import Text
+from threading import Thread
 
 from httpbin.core import app as httpbin
+from werkzeug.serving import make_server
 
 
-def wait_for_port(port: int, host: Text = "127.0.0.1", timeout: float = 5.0):
+def find_free_port() -> int:
     """
-    Wait until a port starts accepting TCP connections.
+    Asks the kernel for a free port. The socket is only bound (not listening)
+    and closed right away, so that nothing is left on the port when the server
+    binds it.
     """
 
-    start_time = time.perf_counter()
-
-    while True:
-        try:
-            with socket.create_connection((host, port), timeout=timeout):
-                break
-        except OSError as ex:
-            time.sleep(0.01)
-            if time.perf_counter() - start_time >= timeout:
-                raise TimeoutError(
-                    "Waited too long for the port {} on host {} to start accepting "
-                    "connections.".format(port, host)
-                ) from ex
-
-
-def find_free_port():
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.bind(("127.0.0.1", 0))
-    s.listen(1)
-    port = s.getsockname()[1]
-    s.close()
-    return port
-
-
-def _run(port):
-    httpbin.run(host="127.0.0.1", port=port)
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
 
 
 class HttpBin:
     def __init__(self, port: int):
         self.port = port
-        self.process = None
+        self.server = None
+        self.thread = None
 
     def run(self):
-        self.process = Process(target=_run, args=(self.port,))
-        self.process.start()
+        """
+        Starts serving httpbin from a background thread. The socket is already
+        listening when this returns.
+        """
+
+        self.server = make_server("127.0.0.1", self.port, httpbin, threaded=True)
+        self.thread = Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
 
     def stop(self):
-        if self.process:
-            self.process.kill()
-            self.process.join()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.thread.join(0.1)
@@ -1,24 +1,22 @@
 import re
-from base64 import b64decode
+from binascii import a2b_base64
 from io import BytesIO
 from typing import Any, Dict, List, NamedTuple, Optional, Text, Union
 
 import httpx
 from httpx import HTTPStatusError
-from pytest import fixture, raises
+from pytest import raises
 
 from typefit import api
 from typefit import httpx_models as hm
 
-from .httpbin_utils import HttpBin, find_free_port, wait_for_port
-
 
 class DataUrl:
     """
     Decodes a Base64 encoded data URL
     """
 
-    exp = re.compile(r"data:(?P<mime>[^;]+);base64,(?P<content>.*)")
+    exp = re.compile(r"data:(?P<mime>[^;]+);base64,(?P<content>.*)", re.ASCII)
 
     def __init__(self, url: Text):
         m = self.exp.match(url)
@@ -27,7 +25,7 @@ class DataUrl:
             raise ValueError
 
         self.mime = m.group("mime")
-        self.content = b64decode(m.group("content").encode())
+        self.content = a2b_base64(m.group("content"))
 
 
 HttpArg = Union[Text, List[Text]]
@@ -63,20 +61,7 @@ class HttpAuth(NamedTuple):
     user: Text
 
 
-@fixture(name="bin_url", scope="module")
-def make_bin_url():
-    port = find_free_port()
-    hb = HttpBin(port)
-    hb.run()
-
-    try:
-        wait_for_port(port, "127.0.0.1")
-        yield f"http://127.0.0.1:{port}/"
-    finally:
-        hb.stop()
-
-
-def test_get_simple(bin_url):
+def test_get_simple(bin_url, http):
     class Bin(api.SyncClient):
         BASE_URL = bin_url
 
@@ -84,12 +69,12 @@ def test_get_simple(bin_url):
         def get(self, value: int) -> HttpGet:
             pass
 
-    get = Bin().get(42)
+    get = Bin(http=http).get(42)
     assert isinstance(get, HttpGet)
     assert get.args["value"] == "42"
 
 
-def test_get_parametric(bin_url):
+def test_get_parametric(bin_url, http):
     class Bin(api.SyncClient):
         BASE_URL = bin_url
 
@@ -97,11 +82,11 @@ def test_get_parametric(bin_url):
         def get(self, value: int) -> HttpGet:
             pass
 
-    get = Bin().get(42)
+    get = Bin(http=http).get(42)
     assert get.args["value"] == "42"
 
 
-def test_get_headers_static(bin_url):
+def test_get_headers_static(bin_url, http):
     class Bin(api.SyncClient):
         BASE_URL = bin_url
 
@@ -112,12 +97,12 @@ def test_get_headers_static(bin_url):
         def get(self) -> HttpGet:
             pass
 
-    get = Bin().get()
+    get = Bin(http=http).get()
     assert get.headers["Foo"] == "Bar"
     assert get.headers["Answer"] == "42"
 
 
-def test_get_headers_parametric(bin_url):
+def test_get_headers_parametric(bin_url, http):
     class Bin(api.SyncClient):
         BASE_URL = bin_url
 
@@ -125,11 +110,11 @@ def test_get_headers_parametric(bin_url):
         def get(self, value: int) -> HttpGet:
             pass
 
-    get = Bin().get(42)
+    get = Bin(http=http).get(42)
     assert get.headers["Answer"] == "42"
 
 
-def test_get_hint(bin_url):
+def test_get_hint(bin_url, http):
     called = set()
 
     class Bin(api.SyncClient):
@@ -154,11 +139,11 @@ def test_get_hint(bin_url):
             assert hint == "foo"
             return super().extract(data, hint)
 
-    Bin().get()
+    Bin(http=http).get()
     assert called == {"raise_errors", "decode", "extract"}
 
 
-def test_get_params_static(bin_url):
+def test_get_params_static(bin_url, http):
     class Bin(api.SyncClient):
         BASE_URL = bin_url
 
@@ -166,11 +151,11 @@ def test_get_params_static(bin_url):
         def get(self) -> HttpGet:
             pass
 
-    get = Bin().get()
+    get = Bin(http=http).get()
     assert get.args["value"] == "42"
 
 
-def test_get_params_parametric(bin_url):
+def test_get_params_parametric(bin_url, http):
     class Bin(api.SyncClient):
         BASE_URL = bin_url
 
@@ -178,11 +163,11 @@ def test_get_params_parametric(bin_url):
         def get(self, value: int) -> HttpGet:
             pass
 
-    get = Bin().get(42)
+    get = Bin(http=http).get(42)
     assert get.args["value"] == "42"
 
 
-def test_get_cookies_static(bin_url):
+def test_get_cookies_static(bin_url, http):
     class Bin(api.SyncClient):
         BASE_URL = bin_url
 
@@ -193,12 +178,12 @@ def test_get_cookies_static(bin_url):
         def test_cookies(self) -> HttpCookies:
             pass
 
-    cookies = Bin().test_cookies()
+    cookies = Bin(http=http).test_cookies()
     assert cookies.cookies["answer"] == "42"
     assert cookies.cookies["foo"] == "bar"
 
 
-def test_get_cookies_parametric(bin_url):
+def test_get_cookies_parametric(bin_url, http):
     class Bin(api.SyncClient):
         BASE_URL = bin_url
 
@@ -206,11 +191,29 @@ def test_get_cookies_parametric(bin_url):
         def test_cookies(self, answer: Text) -> HttpCookies:
             pass
 
-    cookies = Bin().test_cookies("42")
+    cookies = Bin(http=http).test_cookies("42")
     assert cookies.cookies["answer"] == "42"
 
 
-def test_get_auth_static(bin_url):
+def test_get_cookies_shared_http(bin_url, http):
+    class Bin(api.SyncClient):
+        BASE_URL = bin_url
+
+        @api.get("status/500", cookies={"answer": "42"})
+        def fail(self) -> None:
+            pass
+
+        @api.get("cookies")
+        def test_cookies(self) -> HttpCookies:
+            pass
+
+    with raises(HTTPStatusError):
+        Bin(http=http).fail()
+
+    assert "answer" not in http.cookies
+    assert "answer" not in Bin(http=http).test_cookies().cookies
+
+def test_get_auth_static(bin_url, http):
     class Bin(api.SyncClient):
         BASE_URL = bin_url
 
@@ -221,12 +224,12 @@ def test_get_auth_static(bin_url):
         def test_auth(self, user: Text, password: Text) -> HttpAuth:
             pass
 
-    auth = Bin().test_auth("foo", "bar")
+    auth = Bin(http=http).test_auth("foo", "bar")
     assert auth.authenticated
     assert auth.user == "foo"
 
 
-def test_get_auth_parametric(bin_url):
+def test_get_auth_parametric(bin_url, http):
     class Bin(api.SyncClient):
         BASE_URL = bin_url
 
@@ -236,12 +239,12 @@ def test_get_auth_parametric(bin_url):
         def test_auth(self, user: Text, password: Text) -> HttpAuth:
             pass
 
-    auth = Bin().test_auth("foo", "bar")
+    auth = Bin(http=http).test_auth("foo", "bar")
     assert auth.authenticated
     assert auth.user == "foo"
 
 
-def test_allow_redirect_static(bin_url):
+def test_allow_redirect_static(bin_url, http):
     class Bin(api.SyncClient):
         BASE_URL = bin_url
 
@@ -249,11 +252,11 @@ def test_allow_redirect_static(bin_url):
         def redirect(self) -> HttpGet:
             pass
 
-    redirect = Bin().redirect()
+    redirect = Bin(http=http).redirect()
     assert redirect.url.endswith("/get")
 
 
-def test_allow_redirect_parametric(bin_url):
+def test_allow_redirect_parametric(bin_url, http):
     class Bin(api.SyncClient):
         BASE_URL = bin_url
 
@@ -262,10 +265,10 @@ def test_allow_redirect_parametric(bin_url):
             pass
 
     with raises(HTTPStatusError):
-        Bin().redirect()
+        Bin(http=http).redirect()
 
 
-def test_post_data_form(bin_url):
+def test_post_data_form(bin_url, http):
     class Bin(api.SyncClient):
         BASE_URL = bin_url
 
@@ -276,13 +279,13 @@ def test_post_data_form(bin_url):
         def post(self) -> HttpPost:
             pass
 
-    post = Bin().post()
+    post = Bin(http=http).post()
 
     assert post.form["foo"] == ["1", "2"]
     assert post.form["bar"] == "baz"
 
 
-def test_post_data_raw(bin_url):
+def test_post_data_raw(bin_url, http):
     class Bin(api.SyncClient):
         BASE_URL = bin_url
 
@@ -293,12 +296,12 @@ def test_post_data_raw(bin_url):
         def post(self) -> HttpPost:
             pass
 
-    post = Bin().post()
+    post = Bin(http=http).post()
 
     assert post.data == "abc"
 
 
-def test_post_files(bin_url):
+def test_post_files(bin_url, http):
     pixel = (
         b"GIF89a\x01\x00\x01\x00\x80\x01\x00\x00\x00\x00\xff"
         b"\xff\xff!\xf9\x04\x01\x00\x00\x01\x00,\x00\x00\x00"
@@ -314,13 +317,13 @@ def test_post_files(bin_url):
         def post(self) -> HttpPost:
             pass
 
-    post = Bin().post()
+    post = Bin(http=http).post()
 
     assert post.files["pixel"].mime == "image/gif"
     assert post.files["pixel"].content == pixel
 
 
-def test_post_json(bin_url):
+def test_post_json(bin_url, http):
     data = {"foo": "bar", "yoo": [{"foo": 1}, {"bar": False}]}
 
     class Bin(api.SyncClient):
@@ -333,12 +336,12 @@ def test_post_json(bin_url):
         def post(self) -> HttpPost:
             pass
 
-    post = Bin().post()
+    post = Bin(http=http).post()
 
     assert post.json == data
 
 
-def test_put_json(bin_url):
+def test_put_json(bin_url, http):
     data = {"put": True}
 
     class Bin(api.SyncClient):
@@ -351,12 +354,12 @@ def test_put_json(bin_url):
         def put(self) -> HttpPost:
             pass
 
-    put = Bin().put()
+    put = Bin(http=http).put()
 
     assert put.json == data
 
 
-def test_patch_json(bin_url):
+def test_patch_json(bin_url, http):
     data = {"patch": True}
 
     class Bin(api.SyncClient):
@@ -369,6 +372,24 @@ def test_patch_json(bin_url):
         def patch(self) -> HttpPost:
             pass
 
-    patch = Bin().patch()
+    patch = Bin(http=http).patch()
 
     assert patch.json == data
+
+
+def test_init_http(bin_url):
+    class Bin(api.SyncClient):
+        BASE_URL = bin_url
+
+        def init_http(self) -> httpx.Client:
+            return httpx.Client(headers={"X-Foo": "bar"})
+
+        @api.get("get")
+        def get(self) -> HttpGet:
+            pass
+
+    with Bin() as bin_:
+        get = bin_.get()
+
+    assert get.headers["X-Foo"] == "bar"
+    assert bin_.helper.http.is_closed
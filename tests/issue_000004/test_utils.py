@@ -1,4 +1,13 @@
-from typefit.utils import UrlFormatter, loose_call
+import gc
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
+from urllib.parse import quote_plus
+from weakref import ref
+
+from pytest import raises
+
+from typefit import meta, other_field, serialize, typefit
+from typefit.utils import UrlFormatter, compile_url, loose_call, type_cache, url_quote
 
 
 def test_loose_call():
@@ -31,3 +40,99 @@ def test_url_formatter():
     assert f.format("{:>10}", "test") == "++++++test"
     assert f.format("{:f}", 3.141592653589793) == "3.141593"
     assert f.format("{:06.2f}", 3.141592653589793) == "003.14"
+
+
+def test_url_quote():
+    for value in ["", "abc-_.~", "a b+c/d?e=f&g", "räpr 🐍", "%20\n\t"]:
+        assert url_quote(value) == quote_plus(value)
+
+
+def test_compile_url():
+    class Data:
+        x = "a/b"
+
+        def __repr__(self):
+            return "räpr/"
+
+    kwargs = {"value": "a b", "n": 42, "data": Data()}
+
+    for template in [
+        "",
+        "get?value={value}",
+        "{n:+d}/{n:>5}/{{n}}",
+        "{data!r}/{data!a}",
+        "{data.x}/{n:{n}}",
+    ]:
+        assert compile_url(template)(kwargs) == UrlFormatter().format(
+            template, **kwargs
+        )
+
+
+def test_type_cache():
+    calls = []
+
+    @type_cache
+    def name(t):
+        calls.append(t)
+        return f"{t}"
+
+    assert name(int) == name(int)
+    assert name(int | None) == name(int | None)
+    assert calls == [int, int | None]
+
+    with raises(TypeError):
+        name([])
+
+
+def test_type_cache_collected():
+    def fit_classes():
+        @dataclass
+        class Foo:
+            x: int
+            y: Optional[str] = field(
+                default=None, metadata=meta(source=other_field("z"))
+            )
+
+        class Bar(NamedTuple):
+            a: int
+
+        serialize(typefit(Foo, {"x": 1, "z": "a"}))
+        serialize(typefit(Bar, {"a": 1}))
+
+        with raises(ValueError):
+            typefit(Foo, {"y": 1})
+
+        return ref(Foo), ref(Bar)
+
+    refs = fit_classes()
+    gc.collect()
+
+    assert [r() for r in refs] == [None, None]
+
+
+def test_recursive_class_collected():
+    def fit_tree():
+        @dataclass
+        class Tree:
+            value: int
+            children: "list[Tree]"
+            parent: "Tree | None" = None
+
+        # Resolved by hand since the class is local, with builtin generics
+        # since typing would keep its own aliases of the class in a cache
+        Tree.__typefit_hints__ = {
+            "value": int,
+            "children": list[Tree],
+            "parent": Tree | None,
+        }
+
+        tree = typefit(Tree, {"value": 1, "children": [{"value": 2, "children": []}]})
+        assert tree.children[0].value == 2
+        serialize(tree)
+
+        return ref(Tree)
+
+    r = fit_tree()
+    gc.collect()
+
+    assert r() is None
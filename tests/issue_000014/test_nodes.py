@@ -1,9 +1,10 @@
 from dataclasses import dataclass
-from typing import Dict, List, Text
+from typing import Dict, List, Literal, Text
 
 from pytest import fixture, raises
 
 from typefit.fitting import Fitter, FlatNode, ListNode, MappingNode
+from typefit.nodes import get_fit_plan
 
 
 @fixture(name="fitter")
@@ -125,3 +126,120 @@ def test_mapping_node_dataclass_unwanted_field():
     assert not node.fit_success
     assert node.missing_keys == []
     assert node.unwanted_keys == ["z"]
+
+
+def test_fit_plan_cached(fitter: Fitter):
+    @dataclass
+    class Foo:
+        x: int
+        y: int = 0
+
+    plan = get_fit_plan(Foo)
+
+    assert plan is get_fit_plan(Foo)
+    assert plan.params == ("x", "y")
+    assert plan.required == {"x"}
+    assert fitter.fit_node(Foo, fitter._as_node({"x": 1})) == Foo(1)
+    assert fitter.fit_node(Foo, fitter._as_node({"x": 1, "y": 2})) == Foo(1, 2)
+
+
+def test_list_node_flat_items(fitter: Fitter):
+    node = fitter._as_node([1, 2, 3])
+    out = fitter.fit_node(List[int], node)
+
+    assert out == [1, 2, 3]
+    assert out is not node.value
+    assert node.fit_success
+    assert all(child.fit_success for child in node.children)
+
+    assert fitter.fit(List[float], [1, 2.5]) == [1.0, 2.5]
+    assert [type(x) for x in fitter.fit(List[float], [1, 2.5])] == [float, float]
+    assert fitter.fit(List[float], [True, 2.5]) == [1.0, 2.5]
+    assert fitter.fit(List[int], [1, True]) == [1, True]
+
+    with raises(ValueError):
+        fitter.fit(List[bool], [True, 1])
+
+
+def test_list_node_unhashable_item_type(fitter: Fitter):
+    node = fitter._as_node([[1]])
+
+    with raises(ValueError):
+        fitter.fit_node(List[Literal[[1]]], node)
+
+    assert node.problem_is_kids
+    assert not node.fit_success
+
+
+def test_list_node_objects(fitter: Fitter):
+    @dataclass
+    class Point:
+        x: int
+        y: float
+        tags: List[Text]
+        label: Text = ""
+
+    node = fitter._as_node(
+        [{"x": 1, "y": 2, "tags": []}, {"x": 3, "y": 4.5, "tags": ["a"]}]
+    )
+
+    assert fitter.fit_node(List[Point], node) == [
+        Point(1, 2.0, []),
+        Point(3, 4.5, ["a"]),
+    ]
+    assert node.fit_success
+    assert all(child.fit_success for child in node.children)
+
+    assert fitter.fit(
+        List[Point],
+        [{"x": 1, "y": 2, "tags": [], "label": "a"}, {"x": 2, "y": 3, "tags": []}],
+    ) == [
+        Point(1, 2, [], "a"),
+        Point(2, 3, []),
+    ]
+
+    node = fitter._as_node(
+        [{"x": 1, "y": 2, "tags": []}, {"x": "3", "y": 4, "tags": []}]
+    )
+
+    with raises(ValueError):
+        fitter.fit_node(List[Point], node)
+
+    assert node.problem_is_kids
+    assert node.children[0].fit_success
+    assert not node.children[1].fit_success
+    assert not node.children[1].children["x"].fit_success
+
+
+def test_nodes_have_slots(fitter: Fitter):
+    node = fitter._as_node({"a": [1, "b"]})
+
+    for n in [node, node.children["a"], node.children["a"].children[0]]:
+        assert not hasattr(n, "__dict__")
+
+
+def test_list_node_objects_constructor_fails(fitter: Fitter):
+    @dataclass
+    class Positive:
+        x: int
+
+        def __post_init__(self):
+            if self.x < 0:
+                raise ValueError("negative")
+
+    node = fitter._as_node([{"x": 1}, {"x": -1}])
+
+    with raises(ValueError, match="Not all list items fit"):
+        fitter.fit_node(List[Positive], node)
+
+    assert node.problem_is_kids
+    assert not node.fit_success
+
+
+def test_list_node_objects_unhashable_hint(fitter: Fitter):
+    @dataclass
+    class Foo:
+        x: Literal[[1]]
+
+    with raises(ValueError, match="Not all list items fit"):
+        fitter.fit(List[Foo], [{"x": [1]}])
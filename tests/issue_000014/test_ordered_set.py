@@ -1,23 +1,26 @@
+from collections import abc
+from copy import copy
 from random import shuffle
 
 from pytest import raises
 
+from typefit import serialize
 from typefit.utils import OrderedSet
 
 
 def test_init():
     s = OrderedSet([1, 2, 3])
-    assert s._set == {1: True, 2: True, 3: True}
+    assert s._set == dict.fromkeys([1, 2, 3])
 
 
 def test_add():
     s = OrderedSet()
 
     s.add(1)
-    assert s._set == {1: True}
+    assert s._set == dict.fromkeys([1])
 
     s.add(2)
-    assert s._set == {1: True, 2: True}
+    assert s._set == dict.fromkeys([1, 2])
 
 
 def test_order_init():
@@ -85,3 +88,57 @@ def test_subtract():
     s = s1 - s2
 
     assert [*s] == [*range(400, 500)]
+
+
+def test_operations_keep_order():
+    s1 = OrderedSet([3, 1, 2])
+    s2 = OrderedSet([2, 4, 3])
+
+    assert [*(s1 | s2)] == [3, 1, 2, 4]
+    assert [*(s1 & s2)] == [3, 2]
+    assert [*(s1 - s2)] == [1]
+    assert isinstance(s1 | [5], OrderedSet)
+    assert [*(s1 - [3])] == [1, 2]
+
+
+def test_init_empty():
+    assert [*OrderedSet()] == []
+    assert [*OrderedSet([])] == []
+    assert [*OrderedSet(x for x in [2, 1, 2])] == [2, 1]
+
+
+def test_not_a_mapping():
+    s = OrderedSet([1, 2])
+
+    assert isinstance(s, abc.MutableSet)
+    assert not isinstance(s, abc.Mapping)
+    assert s != {1: None, 2: None}
+    assert OrderedSet([1]) != {1: None}
+    assert s == {1, 2}
+
+    with raises(TypeError):
+        serialize(s)
+
+
+def test_copy():
+    s1 = OrderedSet([2, 1])
+
+    for s2 in [s1.copy(), copy(s1)]:
+        assert isinstance(s2, OrderedSet)
+        assert [*s2] == [2, 1]
+
+        s2.add(3)
+        assert [*s1] == [2, 1]
+
+
+def test_pop_clear():
+    s = OrderedSet([2, 1])
+
+    assert s.pop() == 2
+    assert [*s] == [1]
+
+    s.clear()
+    assert [*s] == []
+
+    with raises(KeyError):
+        s.pop()
@@ -6,7 +6,8 @@ from uuid import uuid4
 from pendulum import date, datetime
 
 from typefit import meta, other_field, serialize, typefit
-from typefit.serialize import SaneSerializer
+from typefit.meta import Source
+from typefit.serialize import SaneSerializer, _sane_serializer
 
 
 def test_int():
@@ -62,6 +63,46 @@ def test_dataclass_source():
     assert serialize(Foo(42)) == {"y": 42}
 
 
+def test_dataclass_source_custom():
+    def to_json(name, obj):
+        return {"z": getattr(obj, name) * 2}
+
+    @dataclass
+    class Foo:
+        x: int = field(metadata=meta(source=Source(lambda m: m["z"], to_json)))
+        y: int = field(metadata=meta(source=other_field("x")))
+        z: int = 0
+
+    assert serialize(Foo(1, 2)) == {"z": 2, "x": 2}
+
+
+def test_dataclass_source_other_field_function():
+    def to_json(name, obj):
+        return {"z": f"{getattr(obj, name)}!"}
+
+    other = other_field("z")
+
+    @dataclass
+    class Foo:
+        x: int = field(metadata=meta(source=Source(other.value_from_json, to_json)))
+
+    @dataclass
+    class Bar:
+        x: int = field(metadata=meta(source=Source(lambda m: m["z"], other[1])))
+
+    assert serialize(Foo(1)) == {"z": "1!"}
+    assert serialize(Bar(1)) == {"z": 1}
+
+
+def test_dataclass_source_duplicate():
+    @dataclass
+    class Foo:
+        x: int = field(metadata=meta(source=other_field("y")))
+        y: int = 0
+
+    assert serialize(Foo(1, 2)) == {"y": 1}
+
+
 def test_dataclass_recursive_simple():
     @dataclass
     class Bar:
@@ -133,3 +174,89 @@ def test_int_string():
         x: IntString
 
     assert serialize(Foo(IntString(42))) == {"x": "42"}
+
+
+def test_int_string_after_int():
+    class IntString(int):
+        def __typefit_serialize__(self):
+            return f"{self}"
+
+    s = SaneSerializer()
+
+    assert s.serialize([1, 2]) == [1, 2]
+    assert s.serialize([IntString(1), IntString(2)]) == ["1", "2"]
+    assert s.serialize([1, IntString(2)]) == [1, "2"]
+    assert s.serialize(IntString(3)) == "3"
+
+
+def test_primitive_override():
+    class TenfoldSerializer(SaneSerializer):
+        def find_serializer(self, obj):
+            if obj.__class__ is int:
+                return lambda x: x * 10
+
+            return super().find_serializer(obj)
+
+    s = TenfoldSerializer()
+
+    assert s.serialize([1, 2]) == [10, 20]
+    assert s.serialize({"a": 1, "b": "b"}) == {"a": 10, "b": "b"}
+    assert serialize([1, True, "x", None]) == [1, True, "x", None]
+
+
+def test_subclass_init():
+    class FactorSerializer(SaneSerializer):
+        def __init__(self, factor):
+            self.factor = factor
+
+        def find_serializer(self, obj):
+            if obj.__class__ is int:
+                return lambda x: x * self.factor
+
+            return super().find_serializer(obj)
+
+    s = FactorSerializer(3)
+
+    assert s.serialize([1, "a", {"b": 2}]) == [3, "a", {"b": 6}]
+    assert s.json(2) == "6"
+    assert serialize(2) == 2
+
+
+def test_generic_override():
+    class PrefixSerializer(SaneSerializer):
+        def serialize_generic(self, obj):
+            if isinstance(obj, str):
+                return f"x-{obj}"
+
+            return obj
+
+    s = PrefixSerializer()
+
+    assert s.serialize(["a", 1, {"b": "c"}]) == ["x-a", 1, {"b": "x-c"}]
+    assert s.serialize(["d", "e"]) == ["x-d", "x-e"]
+
+
+def test_serialize_override():
+    class UpperSerializer(SaneSerializer):
+        def serialize(self, obj):
+            if isinstance(obj, str):
+                return obj.upper()
+
+            return super().serialize(obj)
+
+    s = UpperSerializer()
+
+    assert s.serialize(["a", "b"]) == ["A", "B"]
+    assert s.serialize(("a", "b")) == ["A", "B"]
+    assert s.serialize(["a", 1]) == ["A", 1]
+    assert s.serialize([{"a": "b"}, {"c": "d"}]) == [{"a": "B"}, {"c": "D"}]
+
+
+def test_serialize_shortcut_cache():
+    @dataclass
+    class Foo:
+        x: int
+
+    assert serialize(Foo(1)) == {"x": 1}
+    assert Foo in _sane_serializer._class_serializers
+    assert int in _sane_serializer._serializers
@@ -1,9 +1,11 @@
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Mapping
 
 from pytest import raises
 
 from typefit import Fitter, PrettyJson5Formatter, meta, typefit
+from typefit.meta import field_plans
 from typefit.nodes import Node
 from typefit.reporting import ErrorReporter
 
@@ -132,3 +134,63 @@ def test_double_fit():
 
     assert x.a == 1
     assert x.b == 2
+
+
+def test_context_getter():
+    fitter = Fitter(context=dict(a=1))
+    get_a = fitter.context_getter("a")
+
+    assert get_a is fitter.context_getter("a")
+    assert get_a() == 1
+
+    with raises(ValueError):
+        fitter.context_getter("b")()
+
+
+def test_type_hints_stored():
+    typefit(Root, dict(child=dict(value=42)), context=dict(foo=42))
+
+    assert Child.__dict__["__typefit_hints__"]["_root"] is Root
+
+
+def test_type_hints_declared():
+    @dataclass
+    class Unresolved:
+        value: "DoesNotExist"  # noqa: F821
+
+        __typefit_hints__ = {"value": int}
+
+    assert typefit(Unresolved, dict(value=42)) == Unresolved(42)
+
+
+def test_root_injection_fitter_reuse():
+    fitter = Fitter(context=dict(foo=42))
+    a: Root = fitter.fit(Root, dict(child=dict(value=1)))
+    b: Root = fitter.fit(Root, dict(child=dict(value=2)))
+
+    assert a.child._root is a
+    assert b.child._root is b
+    assert fitter.root_injectors == []
+
+
+def test_context_key_interned():
+    key = "".join(["f", "oo"])
+    assert key is not sys.intern("foo")
+
+    @dataclass
+    class Item:
+        value: int = field(metadata=meta(context=key))
+
+    assert field_plans(Item)[0].context is sys.intern("foo")
+
+
+def test_context_replaced():
+    @dataclass
+    class Item:
+        value: int = field(metadata=meta(context="foo"))
+
+    fitter = Fitter(context=dict(foo=1))
+    assert fitter.fit(Item, {}) == Item(1)
+
+    fitter.context = dict(foo=2)
+    assert fitter.fit(Item, {}) == Item(2)
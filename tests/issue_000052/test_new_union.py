@@ -1,6 +1,10 @@
+import gc
 from dataclasses import dataclass
+from weakref import ref
 
-from typefit import typefit
+from pytest import raises
+
+from typefit import Fitter, typefit
 
 
 @dataclass
@@ -22,3 +26,51 @@ def test_new_union():
 
     x = typefit(Foo | Bar, {"b": "hello"})
     assert x == Bar("hello")
+
+
+@dataclass
+class Baz:
+    a: int
+    b: str
+
+
+def test_union_order():
+    assert typefit(Foo | Baz, {"a": 1, "b": "x"}) == Foo(1)
+    assert typefit(Baz | Foo, {"a": 1, "b": "x"}) == Baz(1, "x")
+    assert typefit(Baz | Foo, {"a": 1}) == Foo(1)
+    assert typefit(float | int, 1) == 1.0
+    assert isinstance(typefit(int | float, 1), int)
+
+
+def test_union_errors_order():
+    fitter = Fitter()
+    node = fitter._as_node("x")
+
+    with raises(ValueError):
+        fitter.fit_node(int | Foo | Bar, node)
+
+    assert [*node.errors] == [
+        "Not an int",
+        "'tests.issue_000052.test_new_union.Foo' can only fit an object",
+        "'tests.issue_000052.test_new_union.Bar' can only fit an object",
+        "No matching type in Union",
+    ]
+
+
+def test_union_members_collected():
+    def fit_union():
+        @dataclass
+        class Local:
+            c: int
+
+        assert typefit(Local | Foo, {"c": 1}) == Local(1)
+
+        with raises(ValueError):
+            typefit(Local | Foo, {"d": 1})
+
+        return ref(Local)
+
+    r = fit_union()
+    gc.collect()
+
+    assert r() is None
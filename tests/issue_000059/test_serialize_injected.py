@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 
 from typefit import meta, serialize, typefit
+from typefit.meta import FieldPlan, field_plans
 
 
 @dataclass
@@ -13,3 +14,23 @@ def test_serialize_injected():
     data = {"a": 42}
     x = typefit(Foo, data, context=dict(foo=42))
     assert serialize(x) == data
+
+
+def test_field_plans():
+    assert field_plans(Foo) == (
+        FieldPlan("a"),
+        FieldPlan("b", context="foo"),
+    )
+    assert field_plans(Foo) is field_plans(Foo)
+
+
+def test_field_plans_legacy_metadata():
+    @dataclass
+    class Legacy:
+        a: int = field(metadata={"typefit_from_context": "foo"})
+        b: int = field(metadata={"other": True, **meta(context="bar")})
+
+    assert field_plans(Legacy) == (
+        FieldPlan("a", context="foo"),
+        FieldPlan("b", context="bar"),
+    )